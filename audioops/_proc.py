@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Subprocess helpers shared by the audioops modules
+ffmpeg/ffprobe are started through spawn() (no console window, Windows job
+object, tracked for terminate_children())
+"""
+
+import os
+import subprocess
+import threading
+import weakref
+from typing import List
+
+
+# Processes started through spawn (so a running batch can be cancelled)
+_children = weakref.WeakSet()
+# Set by terminate_children(): queued work must not start new processes
+_terminating = threading.Event()
+_job_lock = threading.Lock()
+_job_handle = None
+
+
+def _job_object():
+    """Windows Job Object that kills every assigned ffmpeg when this process exits."""
+    global _job_handle
+    with _job_lock:
+        if _job_handle is None:
+            import ctypes
+            from ctypes import wintypes
+
+            class IO_COUNTERS(ctypes.Structure):
+                _fields_ = [(name, ctypes.c_ulonglong) for name in (
+                    'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+                    'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount')]
+
+            class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+                _fields_ = [('PerProcessUserTimeLimit', ctypes.c_int64),
+                            ('PerJobUserTimeLimit', ctypes.c_int64),
+                            ('LimitFlags', wintypes.DWORD),
+                            ('MinimumWorkingSetSize', ctypes.c_size_t),
+                            ('MaximumWorkingSetSize', ctypes.c_size_t),
+                            ('ActiveProcessLimit', wintypes.DWORD),
+                            ('Affinity', ctypes.c_size_t),
+                            ('PriorityClass', wintypes.DWORD),
+                            ('SchedulingClass', wintypes.DWORD)]
+
+            class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+                _fields_ = [('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+                            ('IoInfo', IO_COUNTERS),
+                            ('ProcessMemoryLimit', ctypes.c_size_t),
+                            ('JobMemoryLimit', ctypes.c_size_t),
+                            ('PeakProcessMemoryUsed', ctypes.c_size_t),
+                            ('PeakJobMemoryUsed', ctypes.c_size_t)]
+
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+            handle = kernel32.CreateJobObjectW(None, None)
+            if handle:
+                info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+                info.BasicLimitInformation.LimitFlags = 0x2000  # JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+                kernel32.SetInformationJobObject(
+                    wintypes.HANDLE(handle), 9,  # JobObjectExtendedLimitInformation
+                    ctypes.byref(info), ctypes.sizeof(info))
+            _job_handle = (kernel32, handle)
+    return _job_handle
+
+
+def spawn(cmd: List[str], **kwargs) -> subprocess.Popen:
+    """Start a subprocess without a console window.
+
+    On Windows the process is assigned to a shared Job Object, so no ffmpeg
+    outlives the application; every child is tracked for terminate_children().
+    """
+    if _terminating.is_set():
+        raise subprocess.SubprocessError('cancelled: subprocesses are being terminated')
+    if os.name == 'nt':
+        kwargs.setdefault('creationflags', subprocess.CREATE_NO_WINDOW)
+    proc = subprocess.Popen(cmd, **kwargs)
+    if os.name == 'nt':
+        try:
+            import ctypes
+            kernel32, handle = _job_object()
+            if handle:
+                kernel32.AssignProcessToJobObject(
+                    ctypes.c_void_p(handle), ctypes.c_void_p(int(proc._handle)))
+        except (OSError, AttributeError):
+            pass  # e.g. nested jobs not permitted: the process still runs
+    _children.add(proc)
+    if _terminating.is_set():  # terminate_children() ran while this one started
+        proc.terminate()
+    return proc
+
+
+def terminate_children() -> None:
+    """Terminate every running subprocess started through spawn.
+
+    Used when the application exits: from then on spawn refuses to start
+    new processes, so work still queued in the pools fails fast instead of
+    launching ffmpeg again.
+    """
+    _terminating.set()
+    for proc in list(_children):
+        if proc.poll() is None:
+            try:
+                proc.terminate()
+            except OSError:
+                pass
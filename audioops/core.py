@@ -1,28 +1,90 @@
+import os
+import sys
 import subprocess
 import json
+import math
+import mmap
+import operator
 import shlex
+import shutil
+import wave
+from array import array
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from typing import Literal
 
+from ._proc import spawn
 
-def run(cmd: list[str]):
+
+def run(cmd: list[str], stdin=None):
     print("RUN:", " ".join(shlex.quote(x) for x in cmd))
-    subprocess.check_call(cmd)
+    # spawn経由（コンソール非表示・Windowsではジョブオブジェクトに所属）
+    with spawn(cmd, stdin=stdin) as proc:
+        proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
 
-def duration_sec(path: Path) -> float:
-    out = subprocess.check_output([
-        "ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", str(
-            path)
-    ]).decode()
+@lru_cache(maxsize=4096)
+def _duration_cached(path_str: str, mtime_ns: int, size: int) -> float:
+    # mtime/sizeはキャッシュキーのみに使用（ファイル更新時は再プローブ）
+    if path_str.lower().endswith(".wav"):
+        # PCM WAVはヘッダから長さが分かる（ffprobe起動不要）
+        try:
+            with wave.open(path_str, "rb") as w:
+                return w.getnframes() / w.getframerate()
+        except (wave.Error, EOFError):
+            pass
+    cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json",
+           path_str]
+    with spawn(cmd, stdout=subprocess.PIPE) as proc:
+        out = proc.communicate()[0].decode()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
     return float(json.loads(out)["format"]["duration"])
 
 
-def fade_file(infile: Path, outfile: Path,
-              fade_in_ms=0, fade_out_ms=0,
-              fade_out_from_end_sec: float | None = None,
-              fade_out_start_sec: float | None = None,
-              codec="aac"):
-    dur = duration_sec(infile)
+def duration_sec(path: Path) -> float:
+    st = os.stat(path)
+    return _duration_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+# Linux FICLONE ioctl（Btrfs/XFSなどでデータを共有するreflinkコピー）
+_FICLONE = 0x40049409
+
+
+def copy_file(src: Path, dst: Path):
+    # reflink → sendfile（カーネル内コピー） → shutil.copyfile の順に試す
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if sys.platform.startswith("linux"):
+            try:
+                import fcntl
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass
+            try:
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                if offset == size:
+                    return
+            except OSError:
+                pass
+            fdst.seek(0)
+            fdst.truncate()
+    shutil.copyfile(src, dst)
+
+
+def fade_times(dur: float, fade_in_ms=0, fade_out_ms=0,
+               fade_out_from_end_sec: float | None = None,
+               fade_out_start_sec: float | None = None) -> tuple[float, float, float]:
+    # (フェードイン長, フェードアウト開始位置, フェードアウト長) を秒で返す
     fin = max(fade_in_ms/1000, 0.0)
     fout = max(fade_out_ms/1000, 0.0)
     if fade_out_from_end_sec is not None:
@@ -31,43 +93,379 @@ def fade_file(infile: Path, outfile: Path,
         st_out = max(fade_out_start_sec, 0.0)
     else:
         st_out = max(dur - fout, 0.0)
+    return fin, st_out, fout
 
+
+def fade_filters(dur: float, fade_in_ms=0, fade_out_ms=0,
+                 fade_out_from_end_sec: float | None = None,
+                 fade_out_start_sec: float | None = None) -> list[str]:
+    fin, st_out, fout = fade_times(dur, fade_in_ms, fade_out_ms,
+                                   fade_out_from_end_sec, fade_out_start_sec)
     filters = []
     if fin > 0:
         filters.append(f"afade=t=in:st=0:d={fin}")
     if fout > 0:
         filters.append(f"afade=t=out:st={st_out}:d={fout}")
+    return filters
 
-    # フィルターが何もない場合はanullを使用
-    af = ",".join(filters) if filters else "anull"
 
+def codec_for_output(outfile: Path, codec: str) -> str:
     # 出力ファイルの拡張子に応じてコーデックを自動選択
     outfile_ext = outfile.suffix.lower()
     if outfile_ext == '.wav':
-        codec = 'pcm_s16le'  # WAVファイルにはPCMを使用
+        return 'pcm_s16le'  # WAVファイルにはPCMを使用
     elif outfile_ext == '.mp3':
-        codec = 'libmp3lame'
+        return 'libmp3lame'
     elif outfile_ext in ['.m4a', '.aac']:
-        codec = 'aac'
+        return 'aac'
+    return codec
+
+
+# ゲイン表はQ15固定小数点（1.0 = 1 << 15）。16bitサンプルとの積を整数のまま計算できる
+_Q15 = 15
+
+
+def _q15(gains) -> array:
+    return array("i", [round(g * (1 << _Q15)) for g in gains])
+
+
+@lru_cache(maxsize=8)
+def _envelope(n: int, fade_in: bool) -> array:
+    # n フレーム分の直線カーブ（afadeのtri）のゲイン表。同じ設定のフェードでは再計算しない
+    # 直線なのでフレームごとに一定量ずつ変化する（除算はせず delta を掛けるだけ）
+    delta = 1.0 / n
+    if fade_in:
+        return _q15(k * delta for k in range(n))
+    return _q15(1.0 - k * delta for k in range(n))
+
+
+# ビットレート指定が必要なエンコーダ（libshineは固定ビットレートのみ。既定128kより上げる）
+_CODEC_BITRATES = {"libshine": "192k"}
+
+
+def encoder_args(codec: str) -> list[str]:
+    args = ["-c:a", codec]
+    if codec in _CODEC_BITRATES:
+        args += ["-b:a", _CODEC_BITRATES[codec]]
+    return args
+
+
+def _ramp(data: bytes, nchannels: int, env: array) -> bytes:
+    # 16bit PCMの各チャンネルにフレームごとのゲイン表env(Q15)を掛ける（floatを経由しない）
+    samples = array("h")
+    samples.frombytes(data)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    for ch in range(nchannels):
+        samples[ch::nchannels] = array("h", map(
+            operator.rshift,
+            map(operator.mul, samples[ch::nchannels], env), repeat(_Q15)))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+class _MappedWaveRead(wave.Wave_read):
+    # mmap上のWAVを読む（readframesはread()のシステムコールなしにページキャッシュから取得）
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+        super().__init__(mm)
+
+    def close(self):
+        super().close()
+        self._mm.close()
+
+
+def _open_wav_mapped(path: Path) -> wave.Wave_read:
+    # 空ファイルはmmapできないのでValueError
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return _MappedWaveRead(mm)
+    except BaseException:
+        mm.close()
+        raise
+
+
+def _fade_pcm_wav(infile: Path, outfile: Path, fin: float,
+                  st_out: float, fout: float) -> bool:
+    # 16bit PCM WAV → 16bit PCM WAV の場合のみ（出力コーデックpcm_s16leと一致）
+    # フェード区間だけをPython内でゲイン処理し、中間部はそのままコピー（ffmpeg起動なし）
+    try:
+        src = _open_wav_mapped(infile)
+    except (wave.Error, EOFError, ValueError):
+        return False
+    with src:
+        params = src.getparams()
+        if params.sampwidth != 2:
+            return False
+        sr = params.framerate
+        nch = params.nchannels
+        frame_bytes = params.sampwidth * nch
+        fin_n = round(fin * sr)
+        head_n = min(fin_n, params.nframes)
+        tail_start = round(st_out * sr) if fout > 0 else params.nframes
+        fout_n = max(round(fout * sr), 1)
+        if not 0 <= head_n <= tail_start <= params.nframes:
+            return False
+
+        with open(outfile, "wb") as f:
+            # 出力サイズ（44バイトのヘッダ＋全フレーム）を先に確保して断片化を避ける
+            _preallocate(f, 44 + params.nframes * frame_bytes)
+            with wave.open(f, "wb") as dst:
+                dst.setparams(params)
+                if head_n > 0:
+                    # ファイルがフェードインより短い場合はランプの途中で終わる（afadeと同じ）
+                    dst.writeframes(_ramp(src.readframes(head_n), nch,
+                                          _envelope(fin_n, True)))
+                _copy_frames(src, dst, tail_start - head_n, frame_bytes)
+                if tail_start < params.nframes:
+                    # フェードアウト終了後は無音（afade=t=outと同じ）
+                    ramp_n = min(fout_n, params.nframes - tail_start)
+                    dst.writeframes(_ramp(src.readframes(ramp_n), nch,
+                                          _envelope(fout_n, False)))
+                    # ゲイン0の区間は掛け算せずゼロを書くだけ
+                    silent_n = params.nframes - tail_start - ramp_n
+                    if silent_n > 0:
+                        dst.writeframes(bytes(silent_n * frame_bytes))
+            # 見積もりと実際の長さがずれた場合に備えて末尾を切り詰める
+            f.truncate()
+    return True
 
-    run(["ffmpeg", "-y", "-i", str(infile), "-vn",
-        "-af", af, "-c:a", codec, str(outfile)])
+
+def _copy_frames(src, dst, nframes: int, frame_bytes: int):
+    # ゲイン処理しない区間はそのままコピー
+    while nframes > 0:
+        chunk = src.readframes(min(nframes, 1 << 16))
+        if not chunk:
+            break
+        dst.writeframes(chunk)
+        nframes -= len(chunk) // frame_bytes
+
+
+# acrossfadeのカーブのうちPython側で同じゲインを計算できるもの（x: 0→1）
+_CURVES = {
+    "tri": lambda x: x,
+    "qsin": lambda x: math.sin(x * math.pi / 2),
+    "hsin": lambda x: (1 - math.cos(x * math.pi)) / 2,
+    "ipar": lambda x: 1 - (1 - x) * (1 - x),
+    "qua": lambda x: x * x,
+    "cub": lambda x: x * x * x,
+    "squ": math.sqrt,
+    "cbr": lambda x: x ** (1 / 3),
+}
+
+
+@lru_cache(maxsize=8)
+def _crossfade_gains(n: int, curve1: str, curve2: str) -> tuple[array, array, bool]:
+    # 前の入力はcurve1で下げ、次の入力はcurve2で上げる（acrossfadeと同じ向き）
+    # ゲインの和が常に1以下なら合成結果は16bitに収まるので、クリップ不要として返す
+    f1, f2 = _CURVES[curve1], _CURVES[curve2]
+    gain_a = _q15(f1((n - 1 - k) / n) for k in range(n))
+    gain_b = _q15(f2(k / n) for k in range(n))
+    needs_clip = any(map((1 << _Q15).__lt__, map(operator.add, gain_a, gain_b)))
+    return gain_a, gain_b, needs_clip
+
+
+def _clip16(v: int) -> int:
+    return -32768 if v < -32768 else 32767 if v > 32767 else v
+
+
+def _mix(a: bytes, b: bytes, nchannels: int, gain_a: array, gain_b: array,
+         needs_clip: bool = True) -> array:
+    # 16bit PCMのオーバーラップ区間を a*gain_a + b*gain_b で合成（ゲインはQ15）
+    # 結果はaを読み込んだ配列へそのまま上書きして返す（出力用の配列を別に確保しない）
+    sa, sb = array("h"), array("h")
+    sa.frombytes(a)
+    sb.frombytes(b)
+    if sys.byteorder == "big":
+        sa.byteswap()
+        sb.byteswap()
+    n = min(len(sa), len(sb))
+    del sa[n:]
+    for ch in range(nchannels):
+        # 積和とシフトを1本のイテレータにまとめ、途中の配列を作らずに1パスで計算
+        mixed = map(
+            operator.rshift,
+            map(operator.add,
+                map(operator.mul, sa[ch::nchannels], gain_a),
+                map(operator.mul, sb[ch:n:nchannels], gain_b)),
+            repeat(_Q15))
+        sa[ch::nchannels] = array("h", map(_clip16, mixed) if needs_clip else mixed)
+    if sys.byteorder == "big":
+        sa.byteswap()
+    return sa
+
+
+def _crossfade_pcm_wav(inputs: list[Path], outfile: Path, overlap_sec: float,
+                       curve1: str, curve2: str) -> bool:
+    # 全入力が同じ形式の16bit PCM WAVの場合のみ、ffmpegを起動せずにクロスフェード
+    # オーバーラップ区間だけを合成し、それ以外はそのままコピー
+    if curve1 not in _CURVES or curve2 not in _CURVES:
+        return False
+    srcs = []
+    try:
+        for p in inputs:
+            srcs.append(_open_wav_mapped(p))
+    except (wave.Error, EOFError, ValueError):
+        for src in srcs:
+            src.close()
+        return False
+    try:
+        params = srcs[0].getparams()
+        fmt = (2, params.nchannels, params.framerate)
+        if any((w.getsampwidth(), w.getnchannels(), w.getframerate()) != fmt
+               for w in srcs):
+            return False
+        n = round(overlap_sec * params.framerate)
+        lengths = [w.getnframes() for w in srcs]
+        # 中間の入力は前後両方のオーバーラップ分の長さが必要
+        if (n <= 0 or lengths[0] < n or lengths[-1] < n
+                or any(length < 2 * n for length in lengths[1:-1])):
+            return False
+        nch = params.nchannels
+        frame_bytes = 2 * nch
+        gain_a, gain_b, needs_clip = _crossfade_gains(n, curve1, curve2)
+        total = sum(lengths) - n * (len(srcs) - 1)
+
+        with open(outfile, "wb") as f:
+            _preallocate(f, 44 + total * frame_bytes)
+            with wave.open(f, "wb") as dst:
+                dst.setparams(params)
+                last = len(srcs) - 1
+                for i, src in enumerate(srcs):
+                    if i > 0:
+                        dst.writeframes(_mix(tail, src.readframes(n), nch,
+                                             gain_a, gain_b, needs_clip))
+                    body_n = lengths[i] - (n if i > 0 else 0) - (n if i < last else 0)
+                    _copy_frames(src, dst, body_n, frame_bytes)
+                    if i < last:
+                        tail = src.readframes(n)
+            f.truncate()
+        return True
+    finally:
+        for src in srcs:
+            src.close()
+
+
+def _preallocate(f, nbytes: int):
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, nbytes)
+        elif os.name == "nt":
+            # SetEndOfFile相当（NTFSではスパースにならず領域が確保される）
+            f.truncate(nbytes)
+            f.seek(0)
+    except OSError:
+        pass  # 確保できないFSでも書き込み自体は続行
+
+
+def fade_file(infile: Path | Literal['-'], outfile: Path,
+              fade_in_ms=0, fade_out_ms=0,
+              fade_out_from_end_sec: float | None = None,
+              fade_out_start_sec: float | None = None,
+              codec="aac", ffmpeg_path: str | None = None,
+              duration_sec_hint: float | None = None, stdin=None,
+              threads: int = 0):
+    # infile == "-" の場合は stdin からWAVストリームを読む（長さはプローブできない）
+    streamed = str(infile) == "-"
+    if duration_sec_hint is not None:
+        dur = duration_sec_hint
+    elif streamed:
+        raise ValueError("duration_sec_hint is required when reading from stdin")
+    else:
+        dur = duration_sec(infile)
+    filters = fade_filters(dur, fade_in_ms, fade_out_ms,
+                           fade_out_from_end_sec, fade_out_start_sec)
+
+    # PCM WAV同士はffmpegを起動せずフェード区間だけをゲイン処理（中間部はコピー）
+    if (not streamed and filters
+            and os.path.splitext(infile)[1].lower() == ".wav"
+            and outfile.suffix.lower() == ".wav"):
+        fin, st_out, fout = fade_times(dur, fade_in_ms, fade_out_ms,
+                                       fade_out_from_end_sec, fade_out_start_sec)
+        if _fade_pcm_wav(Path(infile), outfile, fin, st_out, fout):
+            return
+
+    # フィルターが何もない場合はanullを使用
+    af = ",".join(filters) if filters else "anull"
+    codec = codec_for_output(outfile, codec)
+
+    input_args = ["-f", "wav", "-i", "pipe:0"] if streamed else ["-i", str(infile)]
+    # threads > 0 でffmpeg自身のスレッド数を制限（複数ジョブ並列時の過剰スレッド防止）
+    thread_args = ["-threads", str(threads)] if threads > 0 else []
+    filter_thread_args = ["-filter_threads", str(threads)] if threads > 0 else []
+    run([ffmpeg_path or "ffmpeg", "-y", *filter_thread_args, *input_args, "-vn",
+        "-af", af, *thread_args, *encoder_args(codec), str(outfile)], stdin=stdin)
+
+
+def fade_batch(inputs: list[Path], outputs: list[Path],
+               fade_in_ms=0, fade_out_ms=0,
+               fade_out_from_end_sec: float | None = None,
+               fade_out_start_sec: float | None = None,
+               codec="aac", ffmpeg_path: str | None = None,
+               durations: list[float] | None = None, threads: int = 0):
+    # 複数ファイルのフェードを1つのffmpegプロセスで処理（起動・コーデック初期化は1回だけ）
+    # 入力ごとに [i:a]afade...[ai] のチェーンを作り、それぞれ別の出力にマップする
+    assert len(inputs) == len(outputs)
+    args = [ffmpeg_path or "ffmpeg", "-y"]
+    if threads > 0:
+        args += ["-filter_complex_threads", str(threads)]
+    for p in inputs:
+        args += ["-i", str(p)]
+    chains = []
+    for i, p in enumerate(inputs):
+        dur = durations[i] if durations is not None else duration_sec(p)
+        filters = fade_filters(dur, fade_in_ms, fade_out_ms,
+                               fade_out_from_end_sec, fade_out_start_sec)
+        chains.append(f"[{i}:a]{','.join(filters) or 'anull'}[a{i}]")
+    args += ["-filter_complex", ";".join(chains)]
+    thread_args = ["-threads", str(threads)] if threads > 0 else []
+    for i, out in enumerate(outputs):
+        args += ["-map", f"[a{i}]", "-vn", *thread_args,
+                 *encoder_args(codec_for_output(out, codec)), str(out)]
+    run(args)
+
+
+def acrossfade_tree(labels: list[str], overlap_sec=2.0,
+                    curve1="tri", curve2="tri") -> tuple[list[str], str]:
+    # 隣接ペアをacrossfadeし、その結果をさらにペアで…と二分木で畳み込む
+    # （直列チェーンと同じタイムラインになるが、独立した部分木は並列に処理できる）
+    chains = []
+    level = list(labels)
+    k = 0
+    while len(level) > 1:
+        next_level = []
+        for j in range(0, len(level) - 1, 2):
+            out = f"[l{k}_{j // 2}]"
+            chains.append(
+                f"{level[j]}{level[j + 1]}acrossfade=d={overlap_sec}:c1={curve1}:c2={curve2}{out}")
+            next_level.append(out)
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+        k += 1
+    return chains, level[0]
 
 
 def crossfade_sequence(inputs: list[Path], outfile: Path, overlap_sec=2.0,
-                       curve1="tri", curve2="tri", codec="libmp3lame"):
+                       curve1="tri", curve2="tri", codec="libmp3lame",
+                       ffmpeg_path: str | None = None, threads: int = 0):
     assert len(inputs) >= 2
-    args = ["ffmpeg", "-y"]
+    # 16bit PCM WAV同士はPython内でオーバーラップ区間だけを合成（ffmpeg起動なし）
+    if (codec == "pcm_s16le" and outfile.suffix.lower() == ".wav"
+            and all(os.path.splitext(p)[1].lower() == ".wav" for p in inputs)
+            and _crossfade_pcm_wav(inputs, outfile, overlap_sec, curve1, curve2)):
+        return
+    args = [ffmpeg_path or "ffmpeg", "-y"]
+    if threads > 0:
+        args += ["-filter_threads", str(threads),
+                 "-filter_complex_threads", str(threads)]
     for p in inputs:
         args += ["-i", str(p)]
-    chains = []
-    prev = "[0:a]"
-    for i in range(1, len(inputs)):
-        out = f"[a{i}]"
-        chains.append(
-            f"{prev}[{i}:a]acrossfade=d={overlap_sec}:c1={curve1}:c2={curve2}{out}")
-        prev = out
+    chains, out = acrossfade_tree(
+        [f"[{i}:a]" for i in range(len(inputs))], overlap_sec, curve1, curve2)
     filter_complex = ";".join(chains)
     args += ["-filter_complex", filter_complex,
-             "-map", prev, "-c:a", codec, str(outfile)]
+             "-map", out, *encoder_args(codec), str(outfile)]
     run(args)
@@ -6,13 +6,22 @@ LoudSync Legacy Functions
 """
 
 import os
+import re
 import sys
 import json
 import subprocess
 import shutil
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, List, Optional
+
+from ._proc import spawn
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing
+    orjson = None
 
 
 class LoudSyncError(Exception):
@@ -20,8 +29,66 @@ class LoudSyncError(Exception):
     pass
 
 
+# loudnorm filter templates (measurement / 1-pass / 2nd pass with measured values)
+_LOUDNORM_MEASURE_TMPL = 'loudnorm=I={}:TP={}:LRA=11:print_format=json'
+_LOUDNORM_1PASS_TMPL = 'loudnorm=I={}:TP={}:LRA=11'
+_LOUDNORM_TMPL = ('loudnorm=I={}:TP={}:LRA=11:measured_I={}:measured_TP={}:'
+                  'measured_LRA={}:measured_thresh={}:offset={}:'
+                  'linear=true:print_format=summary')
+
+
+# Targets come from a handful of presets, so the formatted strings are reused
+@lru_cache(maxsize=64)
+def _loudnorm_measure_filter(target_i: float, target_tp: float) -> str:
+    return _LOUDNORM_MEASURE_TMPL.format(target_i, target_tp)
+
+
+@lru_cache(maxsize=64)
+def _loudnorm_1pass_filter(target_i: float, target_tp: float) -> str:
+    return _LOUDNORM_1PASS_TMPL.format(target_i, target_tp)
+
+
+# Leave headroom below the 32767-character CreateProcess limit
+_WIN_CMDLINE_LIMIT = 30000
+
+# Input duration as reported by ffmpeg ("Duration: 00:03:25.12, ...")
+_DURATION_RE = re.compile(r'Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)')
+
+# ebur128 summary block (printed once at the end of the run)
+_EBUR128_I_RE = re.compile(r'I:\s*(-?\d+(?:\.\d+)?)\s*LUFS')
+_EBUR128_LRA_RE = re.compile(r'LRA:\s*(-?\d+(?:\.\d+)?)\s*LU\b')
+_EBUR128_PEAK_RE = re.compile(r'Peak:\s*(-?(?:\d+(?:\.\d+)?|inf))\s*dBFS')
+_EBUR128_THRESH_RE = re.compile(r'Threshold:\s*(-?\d+(?:\.\d+)?)\s*LUFS')
+
+# First audio stream of the input ("Stream #0:0(und): Audio: aac (LC) ..., 48000 Hz")
+_AUDIO_STREAM_RE = re.compile(r'Stream #0:\d+[^:\n]*: Audio: (\w+)[^,\n]*, (\d+) Hz')
+
+# Files measured within this many LU of the target (and under the true-peak
+# limit) are copied instead of being re-encoded, if the format already matches
+_ON_TARGET_TOLERANCE_LU = 0.5
+_OUTPUT_CODECS = {'wav': 'pcm_s16le', 'mp3': 'mp3', 'm4a': 'aac'}
+
+# Per-input sections of a multi-input measurement run
+_INPUT_DURATION_RE = re.compile(r'^Input #(\d+),.*?\n\s*Duration:[^,\n]*', re.M | re.S)
+_EBUR128_SUMMARY_RE = re.compile(r'\[Parsed_ebur128_(\d+) @ [^\]]*\]\s*Summary:')
+_LOUDNORM_JSON_RE = re.compile(r'\[Parsed_loudnorm_(\d+) @ [^\]]*\]\s*(\{[^{}]*\})', re.S)
+
+
+def _run(cmd: List[str]) -> subprocess.CompletedProcess:
+    """Run ffmpeg on top of spawn and capture its stderr as text.
+
+    Every caller writes to files or the null muxer, so stdout is discarded
+    instead of being piped and decoded (CompletedProcess.stdout is None).
+    """
+    with spawn(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                text=True, encoding='utf-8', errors='replace') as proc:
+        _, stderr = proc.communicate()
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, stderr)
+
+
+@lru_cache(maxsize=None)
 def find_ffmpeg() -> str:
-    """Find ffmpeg executable path."""
+    """Find ffmpeg executable path (resolved once per process)."""
     # Try system PATH first
     ffmpeg = shutil.which('ffmpeg')
     if ffmpeg:
@@ -42,57 +109,191 @@ def find_ffmpeg() -> str:
         "ffmpeg not found. Please install ffmpeg or place it in bin/ directory.")
 
 
+def threads_per_invocation(n_workers: int) -> int:
+    """ffmpeg -threads value when n_workers ffmpeg processes run concurrently.
+
+    Without a cap every ffmpeg sizes its own thread pool to the whole machine,
+    so N concurrent processes oversubscribe the CPU N times over.
+    """
+    n_workers = max(1, n_workers)
+    return max(1, (os.cpu_count() or n_workers) // n_workers)
+
+
+def _filter_thread_args(threads: int) -> List[str]:
+    """Global options capping ffmpeg's filtergraph threads (empty for threads <= 0).
+
+    -threads only limits the codecs; the filtergraphs size their own thread
+    pools to the machine unless these are given as well.
+    """
+    if threads <= 0:
+        return []
+    return ['-filter_threads', str(threads), '-filter_complex_threads', str(threads)]
+
+
+def _parse_duration(text: str) -> Optional[float]:
+    """Parse the input duration from ffmpeg stderr (None if not available)."""
+    match = _DURATION_RE.search(text)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _parse_audio_stream(text: str) -> tuple:
+    """(codec, sample rate) of the input's first audio stream, or (None, None)."""
+    match = _AUDIO_STREAM_RE.search(text)
+    if not match:
+        return None, None
+    return match.group(1), int(match.group(2))
+
+
 def find_audio_files(input_dir: str, extensions: List[str]) -> List[Path]:
     """Find audio files in directory."""
     input_path = Path(input_dir)
     if not input_path.exists():
         raise LoudSyncError(f"Input directory not found: {input_dir}")
 
-    files = []
-    for ext in extensions:
-        pattern = f"**/*{ext}" if ext.startswith('.') else f"**/*.{ext}"
-        files.extend(input_path.glob(pattern))
+    # Single walk over the tree, matching against a set of suffixes
+    exts = {e.lower() if e.startswith('.') else f".{e.lower()}" for e in extensions}
+    found = []
+    for root, _, names in os.walk(input_path):
+        for name in names:
+            if os.path.splitext(name)[1].lower() in exts:
+                found.append((os.path.normcase(root), os.path.normcase(name), root, name))
+
+    # Sort by (directory, name) so that files of one directory stay together
+    found.sort()
+    return [Path(root, name) for _, _, root, name in found]
+
 
-    return sorted(files)
+# Successful measurements of this process, keyed by file identity (path, mtime,
+# size) and measurement settings, so that measure -> normalize of the same files
+# does not decode each file twice
+_measurement_cache: Dict[tuple, Dict] = {}
 
 
-def measure_loudness(file_path: str, ffmpeg_path: str, target_i: float = -16.0, target_tp: float = -1.5) -> Dict:
-    """Measure loudness of audio file using ffmpeg."""
+def _measurement_key(file_path: str, measurement: str,
+                     target_i: float = None, target_tp: float = None) -> Optional[tuple]:
+    """Cache key for a measurement (None if the file cannot be stat'ed)."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    # loudnorm's report (target_offset) depends on the targets; ebur128's does not
+    targets = (target_i, target_tp) if measurement == 'loudnorm' else ()
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, measurement, *targets)
+
+
+def _cached_measurement(file_path: str, key: Optional[tuple]) -> Optional[Dict]:
+    cached = _measurement_cache.get(key) if key is not None else None
+    return dict(cached, file=file_path) if cached is not None else None
+
+
+def _remember_measurement(key: Optional[tuple], result: Dict) -> Dict:
+    # Failures are not cached so that they are retried on the next run
+    if key is not None and result['status'] == 'OK':
+        _measurement_cache[key] = result
+    return result
+
+
+def measurement_cache_entries(file_paths: Optional[Iterable] = None) -> List[list]:
+    """Cached measurements as JSON-serializable [key, result] pairs.
+
+    Entries whose file has since changed or disappeared are left out; with
+    file_paths, only the entries of those files are returned.
+    """
+    wanted = (None if file_paths is None
+              else {os.path.abspath(p) for p in file_paths})
+    entries = []
+    for key, result in list(_measurement_cache.items()):
+        if wanted is not None and key[0] not in wanted:
+            continue
+        current = _measurement_key(key[0], key[3], *key[4:])
+        if current == key:
+            entries.append([list(key), result])
+    return entries
+
+
+def restore_measurement_cache(entries: List[list]) -> None:
+    """Load [key, result] pairs saved by measurement_cache_entries()."""
+    for key, result in entries:
+        _measurement_cache.setdefault(tuple(key), result)
+
+
+def measure_loudness(file_path: str, ffmpeg_path: str, target_i: float = -16.0, target_tp: float = -1.5,
+                     threads: int = 0, measurement: str = 'loudnorm') -> Dict:
+    """Measure loudness of audio file using ffmpeg.
+
+    measurement='loudnorm' (default) runs the loudnorm first pass and parses
+    its JSON report; measurement='ebur128' reads the ebur128 summary instead,
+    which is faster (no gain/limiter simulation) but only approximates the
+    report for a loudnorm 2nd pass (see _ebur128_as_loudnorm).
+    """
+    if measurement == 'ebur128':
+        return measure_ebur128(file_path, ffmpeg_path, threads)
+
+    key = _measurement_key(file_path, measurement, target_i, target_tp)
+    cached = _cached_measurement(file_path, key)
+    if cached is not None:
+        return cached
+    return _remember_measurement(
+        key, _loudnorm_first_pass(file_path, ffmpeg_path, target_i, target_tp, threads))
+
+
+def _loudnorm_first_pass(file_path: str, ffmpeg_path: str, target_i: float,
+                         target_tp: float, threads: int = 0) -> Dict:
+    """Run loudnorm's first pass and parse its JSON report."""
     try:
         cmd = [
             ffmpeg_path, '-hide_banner', '-nostats',
+            *_filter_thread_args(threads),
             '-i', file_path,
-            '-af', f'loudnorm=I={target_i}:TP={target_tp}:LRA=11:print_format=json',
+            '-af', _loudnorm_measure_filter(target_i, target_tp),
+            *(['-threads', str(threads)] if threads > 0 else []),
             '-f', 'null', '-'
         ]
 
-        result = subprocess.run(cmd, capture_output=True,
-                                text=True, encoding='utf-8', errors='replace',
-                                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0)
-
-        # Extract JSON from stderr
-        stderr_lines = result.stderr.split('\n')
-        json_started = False
+        # Read stderr incrementally and stop as soon as the JSON block is complete
         json_lines = []
-
-        for line in stderr_lines:
-            if '{' in line and not json_started:
-                json_started = True
-            if json_started:
+        duration = None
+        stream = None
+        depth = 0
+        with spawn(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                    text=True, encoding='utf-8', errors='replace', bufsize=1) as proc:
+            for line in proc.stderr:
+                if not json_lines and '{' not in line:
+                    if duration is None and 'Duration:' in line:
+                        duration = _parse_duration(line)
+                    elif stream is None and 'Audio:' in line:
+                        stream = line
+                    continue
                 json_lines.append(line)
-                if '}' in line:
+                depth += line.count('{') - line.count('}')
+                if depth <= 0:
                     break
+            # Don't let ffmpeg linger once the summary has been read
+            if proc.poll() is None:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
 
-        json_text = '\n'.join(json_lines)
+        json_text = ''.join(json_lines)
+
+        codec, rate = _parse_audio_stream(stream or '')
 
         # Parse JSON
         try:
-            json_data = json.loads(json_text)
+            json_data = orjson.loads(json_text) if orjson else json.loads(json_text)
             return {
                 'file': file_path,
                 'integrated_lufs': float(json_data.get('input_i', 0)),
                 'loudness_range': float(json_data.get('input_lra', 0)),
                 'true_peak_dbtp': float(json_data.get('input_tp', 0)),
+                'duration_sec': duration,
+                'input_codec': codec,
+                'sample_rate': rate,
                 'status': 'OK',
                 'raw_json': json_data
             }
@@ -117,60 +318,322 @@ def measure_loudness(file_path: str, ffmpeg_path: str, target_i: float = -16.0,
         }
 
 
+def measure_ebur128(file_path: str, ffmpeg_path: str, threads: int = 0) -> Dict:
+    """Measure loudness with the ebur128 filter (no loudnorm gain simulation)."""
+    key = _measurement_key(file_path, 'ebur128')
+    cached = _cached_measurement(file_path, key)
+    if cached is not None:
+        return cached
+    return _remember_measurement(key, _run_ebur128(file_path, ffmpeg_path, threads))
+
+
+def _run_ebur128(file_path: str, ffmpeg_path: str, threads: int = 0) -> Dict:
+    """Run the ebur128 filter and parse its summary."""
+    try:
+        cmd = [
+            ffmpeg_path, '-hide_banner', '-nostats',
+            *_filter_thread_args(threads),
+            '-i', file_path,
+            '-af', 'ebur128=peak=true:framelog=verbose',
+            *(['-threads', str(threads)] if threads > 0 else []),
+            '-f', 'null', '-'
+        ]
+
+        result = _run(cmd)
+
+        summary = result.stderr[result.stderr.rfind('Summary:'):]
+        match_i = _EBUR128_I_RE.search(summary)
+        match_lra = _EBUR128_LRA_RE.search(summary)
+        match_peak = _EBUR128_PEAK_RE.search(summary)
+        match_thresh = _EBUR128_THRESH_RE.search(summary)
+        if not match_i:
+            return {
+                'file': file_path,
+                'integrated_lufs': None,
+                'loudness_range': None,
+                'true_peak_dbtp': None,
+                'status': 'PARSE_ERROR: ebur128 summary not found',
+                'raw_json': None
+            }
+
+        codec, rate = _parse_audio_stream(result.stderr)
+        return {
+            'file': file_path,
+            'integrated_lufs': float(match_i.group(1)),
+            'loudness_range': float(match_lra.group(1)) if match_lra else None,
+            'true_peak_dbtp': float(match_peak.group(1)) if match_peak else None,
+            'duration_sec': _parse_duration(result.stderr),
+            'input_codec': codec,
+            'sample_rate': rate,
+            'status': 'OK',
+            'raw_json': _ebur128_as_loudnorm(match_i, match_lra, match_peak, match_thresh)
+        }
+
+    except subprocess.SubprocessError as e:
+        return {
+            'file': file_path,
+            'integrated_lufs': None,
+            'loudness_range': None,
+            'true_peak_dbtp': None,
+            'status': f'FFMPEG_ERROR: {str(e)}',
+            'raw_json': None
+        }
+
+
+def _measure_error(file_path: str, status: str) -> Dict:
+    """Result dict for a file whose measurement failed."""
+    return {
+        'file': file_path,
+        'integrated_lufs': None,
+        'loudness_range': None,
+        'true_peak_dbtp': None,
+        'status': status,
+        'raw_json': None
+    }
+
+
+def measure_loudness_batch(file_paths: List[str], ffmpeg_path: str,
+                           target_i: float = -16.0, target_tp: float = -1.5,
+                           threads: int = 0, measurement: str = 'loudnorm') -> List[Dict]:
+    """Measure several files in a single ffmpeg process.
+
+    Each input gets its own measurement filter ([i:a]filter[mi]) mapped to its
+    own null output; the per-input reports are matched back to the files by
+    filter instance number. Results are in the order of file_paths and have
+    the same keys as measure_loudness(); files whose report is missing (e.g.
+    the batch failed) get a non-OK status so the caller can retry them alone.
+    """
+    # Files measured earlier in this process are not decoded again
+    keys = [_measurement_key(p, measurement, target_i, target_tp) for p in file_paths]
+    cached = [_cached_measurement(p, key) for p, key in zip(file_paths, keys)]
+    pending = [i for i, result in enumerate(cached) if result is None]
+    if len(pending) < len(file_paths):
+        if pending:
+            measured = measure_loudness_batch(
+                [file_paths[i] for i in pending], ffmpeg_path,
+                target_i, target_tp, threads, measurement)
+            for i, result in zip(pending, measured):
+                cached[i] = result
+        return cached
+
+    if measurement == 'ebur128':
+        af = 'ebur128=peak=true:framelog=verbose'
+    else:
+        af = _loudnorm_measure_filter(target_i, target_tp)
+
+    cmd = [ffmpeg_path, '-hide_banner', '-nostats', *_filter_thread_args(threads)]
+    for file_path in file_paths:
+        cmd.extend(['-i', file_path])
+    cmd.extend(['-filter_complex', ';'.join(
+        f'[{i}:a]{af}[m{i}]' for i in range(len(file_paths)))])
+    for i in range(len(file_paths)):
+        cmd.extend(['-map', f'[m{i}]'])
+        if threads > 0:
+            cmd.extend(['-threads', str(threads)])
+        cmd.extend(['-f', 'null', '-'])
+
+    # Windows command lines are limited to 32767 chars: let the caller fall back
+    if os.name == 'nt' and len(subprocess.list2cmdline(cmd)) > _WIN_CMDLINE_LIMIT:
+        return [_measure_error(p, 'BATCH_ERROR: command line too long')
+                for p in file_paths]
+
+    try:
+        stderr = _run(cmd).stderr
+    except (subprocess.SubprocessError, OSError) as e:
+        return [_measure_error(p, f'FFMPEG_ERROR: {str(e)}') for p in file_paths]
+
+    durations = {int(m.group(1)): _parse_duration(m.group(0))
+                 for m in _INPUT_DURATION_RE.finditer(stderr)}
+    results = [_measure_error(p, 'BATCH_ERROR: no report for this input')
+               for p in file_paths]
+
+    if measurement == 'ebur128':
+        headers = list(_EBUR128_SUMMARY_RE.finditer(stderr))
+        for m, next_m in zip(headers, headers[1:] + [None]):
+            i = int(m.group(1))
+            if i >= len(file_paths):
+                continue
+            summary = stderr[m.end():next_m.start() if next_m else len(stderr)]
+            match_i = _EBUR128_I_RE.search(summary)
+            if not match_i:
+                continue
+            match_lra = _EBUR128_LRA_RE.search(summary)
+            match_peak = _EBUR128_PEAK_RE.search(summary)
+            match_thresh = _EBUR128_THRESH_RE.search(summary)
+            results[i] = {
+                'file': file_paths[i],
+                'integrated_lufs': float(match_i.group(1)),
+                'loudness_range': float(match_lra.group(1)) if match_lra else None,
+                'true_peak_dbtp': float(match_peak.group(1)) if match_peak else None,
+                'duration_sec': durations.get(i),
+                'status': 'OK',
+                'raw_json': _ebur128_as_loudnorm(match_i, match_lra, match_peak, match_thresh)
+            }
+    else:
+        for m in _LOUDNORM_JSON_RE.finditer(stderr):
+            i = int(m.group(1))
+            if i >= len(file_paths):
+                continue
+            try:
+                json_data = orjson.loads(m.group(2)) if orjson else json.loads(m.group(2))
+                results[i] = {
+                    'file': file_paths[i],
+                    'integrated_lufs': float(json_data.get('input_i', 0)),
+                    'loudness_range': float(json_data.get('input_lra', 0)),
+                    'true_peak_dbtp': float(json_data.get('input_tp', 0)),
+                    'duration_sec': durations.get(i),
+                    'status': 'OK',
+                    'raw_json': json_data
+                }
+            except (json.JSONDecodeError, ValueError) as e:
+                results[i] = _measure_error(file_paths[i], f'JSON_ERROR: {str(e)}')
+
+    for key, result in zip(keys, results):
+        _remember_measurement(key, result)
+    return results
+
+
+def _ebur128_as_loudnorm(match_i, match_lra, match_peak, match_thresh) -> Optional[Dict]:
+    """Express an ebur128 summary in loudnorm's JSON keys (for the 2nd pass).
+
+    This is an approximation: input_thresh is ebur128's gating threshold and
+    target_offset is 0, whereas loudnorm's own first pass reports values from
+    its limiter simulation. Only used when ebur128 measurement is opted into.
+    """
+    if not (match_i and match_lra and match_peak and match_thresh):
+        return None
+    if match_peak.group(1).endswith('inf'):
+        return None  # digital silence: let loudnorm fall back to 1-pass
+    return {
+        'input_i': match_i.group(1),
+        'input_tp': match_peak.group(1),
+        'input_lra': match_lra.group(1),
+        'input_thresh': match_thresh.group(1),
+        'target_offset': '0.00'
+    }
+
+
+def linear_gain_filter(measured_i: float, target_i: float, target_tp: float) -> str:
+    """Build a linear gain + true-peak limiter chain (alternative to 2-pass loudnorm).
+
+    The limiter runs at 192 kHz so that inter-sample peaks are caught; the
+    caller resamples back to the output rate.
+    """
+    gain_db = target_i - measured_i
+    tp_linear = 10 ** (target_tp / 20)
+    return (f'volume={gain_db:.2f}dB,aresample=192000,'
+            f'alimiter=limit={tp_linear:.4f}:attack=5:release=50:level=disabled')
+
+
+def loudnorm_filter(target_i: float, target_tp: float, measured: Optional[Dict] = None) -> str:
+    """Build the loudnorm filter string (2nd pass when measured values are given)."""
+    if measured is None:
+        return _loudnorm_1pass_filter(target_i, target_tp)
+    return _LOUDNORM_TMPL.format(
+        target_i, target_tp,
+        measured['input_i'], measured['input_tp'], measured['input_lra'],
+        measured['input_thresh'], measured['target_offset'])
+
+
+def codec_args(output_format: str) -> List[str]:
+    """ffmpeg codec arguments for an output format."""
+    if output_format.lower() == 'wav':
+        return ['-c:a', 'pcm_s16le']
+    elif output_format.lower() == 'mp3':
+        return ['-c:a', 'libmp3lame', '-q:a', '2']
+    elif output_format.lower() == 'm4a':
+        return ['-c:a', 'aac', '-b:a', '128k']
+    return []
+
+
+def _already_on_target(input_path: str, measured: Dict, target_i: float, target_tp: float,
+                       sample_rate: int, output_format: str) -> bool:
+    """True if the input can be copied as the output without re-encoding.
+
+    Its loudness must be within _ON_TARGET_TOLERANCE_LU of the target, its
+    true peak under the limit, and container, codec and sample rate must
+    already be what the output would get.
+    """
+    output_format = output_format.lower()
+    tp = measured.get('true_peak_dbtp')
+    return (os.path.splitext(input_path)[1][1:].lower() == output_format
+            and measured.get('input_codec') == _OUTPUT_CODECS.get(output_format)
+            and measured.get('sample_rate') == sample_rate
+            and tp is not None and tp <= target_tp
+            and abs(measured['integrated_lufs'] - target_i) < _ON_TARGET_TOLERANCE_LU)
+
+
 def normalize_audio(input_path: str, output_path: str, target_i: float, target_tp: float,
                     sample_rate: int = 48000, output_format: str = 'wav',
-                    two_pass: bool = True, ffmpeg_path: str = None) -> bool:
-    """Normalize audio file using ffmpeg loudnorm."""
+                    two_pass: bool = True, ffmpeg_path: str = None,
+                    threads: int = 0, mode: str = 'loudnorm_2pass',
+                    measured: Optional[Dict] = None) -> bool:
+    """Normalize audio file using ffmpeg loudnorm.
+
+    threads > 0 caps ffmpeg's own thread count so that several files can be
+    processed concurrently without oversubscribing the CPU.
+    mode='linear_gain' measures with ebur128 and applies a plain gain plus
+    true-peak limiter instead of loudnorm (faster for short clips).
+    measured: result of an earlier measure_loudness/measure_ebur128 call for
+    this file; when given, the measurement pass is skipped.
+    A measured file that already meets the target in the output's format is
+    copied instead of being re-encoded.
+    """
     try:
         if ffmpeg_path is None:
             ffmpeg_path = find_ffmpeg()
 
-        if two_pass:
+        measure_result = None
+
+        if mode == 'linear_gain':
+            # First pass: ebur128 measurement / second pass: linear gain + limiter
+            measure_result = measured or measure_ebur128(input_path, ffmpeg_path, threads)
+            if measure_result['status'] != 'OK':
+                print(
+                    f"Measurement failed for {input_path}, falling back to 1-pass")
+                return normalize_audio(input_path, output_path, target_i, target_tp,
+                                       sample_rate, output_format, two_pass=False,
+                                       ffmpeg_path=ffmpeg_path, threads=threads)
+            af = linear_gain_filter(
+                measure_result['integrated_lufs'], target_i, target_tp)
+        elif two_pass:
             # First pass: measure
-            measure_result = measure_loudness(
-                input_path, ffmpeg_path, target_i, target_tp)
+            measure_result = measured or measure_loudness(
+                input_path, ffmpeg_path, target_i, target_tp, threads)
             if measure_result['status'] != 'OK' or not measure_result['raw_json']:
                 print(
                     f"Measurement failed for {input_path}, falling back to 1-pass")
                 return normalize_audio(input_path, output_path, target_i, target_tp,
-                                       sample_rate, output_format, two_pass=False, ffmpeg_path=ffmpeg_path)
+                                       sample_rate, output_format, two_pass=False,
+                                       ffmpeg_path=ffmpeg_path, threads=threads)
 
             # Second pass: apply normalization
-            json_data = measure_result['raw_json']
-            cmd = [
-                ffmpeg_path, '-hide_banner', '-y',
-                '-i', input_path,
-                '-af', (f'loudnorm=I={target_i}:TP={target_tp}:LRA=11:'
-                        f'measured_I={json_data["input_i"]}:'
-                        f'measured_TP={json_data["input_tp"]}:'
-                        f'measured_LRA={json_data["input_lra"]}:'
-                        f'measured_thresh={json_data["input_thresh"]}:'
-                        f'offset={json_data["target_offset"]}:'
-                        f'linear=true:print_format=summary'),
-                '-ar', str(sample_rate)
-            ]
+            af = loudnorm_filter(target_i, target_tp, measure_result['raw_json'])
         else:
             # One pass normalization
-            cmd = [
-                ffmpeg_path, '-hide_banner', '-y',
-                '-i', input_path,
-                '-af', f'loudnorm=I={target_i}:TP={target_tp}:LRA=11',
-                '-ar', str(sample_rate)
-            ]
+            af = loudnorm_filter(target_i, target_tp)
 
-        # Add codec and output path
-        if output_format.lower() == 'wav':
-            cmd.extend(['-c:a', 'pcm_s16le'])
-        elif output_format.lower() == 'mp3':
-            cmd.extend(['-c:a', 'libmp3lame', '-q:a', '2'])
-        elif output_format.lower() == 'm4a':
-            cmd.extend(['-c:a', 'aac', '-b:a', '128k'])
+        if measure_result is not None and _already_on_target(
+                input_path, measure_result, target_i, target_tp, sample_rate, output_format):
+            shutil.copyfile(input_path, output_path)
+            return True
+
+        cmd = [
+            ffmpeg_path, '-hide_banner', '-y',
+            *_filter_thread_args(threads),
+            '-i', input_path,
+            '-af', af,
+            '-ar', str(sample_rate)
+        ]
 
+        if threads > 0:
+            cmd.extend(['-threads', str(threads)])
+
+        # Add codec and output path
+        cmd.extend(codec_args(output_format))
         cmd.append(output_path)
 
-        result = subprocess.run(cmd, capture_output=True,
-                                text=True, encoding='utf-8', errors='replace',
-                                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0)
+        result = _run(cmd)
 
         if result.returncode == 0:
             return True
@@ -181,3 +644,48 @@ def normalize_audio(input_path: str, output_path: str, target_i: float, target_t
     except Exception as e:
         print(f"Normalization error for {input_path}: {str(e)}")
         return False
+
+
+def normalize_batch(input_paths: List[str], output_paths: List[str], filters: List[str],
+                    sample_rate: int = 48000, output_formats: Optional[List[str]] = None,
+                    ffmpeg_path: str = None, threads: int = 0) -> bool:
+    """Normalize several files in a single ffmpeg process.
+
+    Each input gets its own filter chain ([i:a]filter[oi]) and is mapped to its
+    own output, so process startup and codec init are paid once per batch.
+    """
+    try:
+        if ffmpeg_path is None:
+            ffmpeg_path = find_ffmpeg()
+        if output_formats is None:
+            output_formats = [os.path.splitext(p)[1][1:] for p in output_paths]
+
+        cmd = [ffmpeg_path, '-hide_banner', '-y', *_filter_thread_args(threads)]
+        for input_path in input_paths:
+            cmd.extend(['-i', input_path])
+        cmd.extend(['-filter_complex', ';'.join(
+            f'[{i}:a]{af}[o{i}]' for i, af in enumerate(filters))])
+
+        for i, (output_path, output_format) in enumerate(zip(output_paths, output_formats)):
+            cmd.extend(['-map', f'[o{i}]', '-ar', str(sample_rate)])
+            if threads > 0:
+                cmd.extend(['-threads', str(threads)])
+            cmd.extend(codec_args(output_format))
+            cmd.append(output_path)
+
+        # Windows command lines are limited to 32767 chars: let the caller fall back
+        if os.name == 'nt' and len(subprocess.list2cmdline(cmd)) > _WIN_CMDLINE_LIMIT:
+            print("Batch command line too long, falling back to per-file processing")
+            return False
+
+        result = _run(cmd)
+
+        if result.returncode == 0:
+            return True
+        else:
+            print(f"FFmpeg batch error: {result.stderr}")
+            return False
+
+    except Exception as e:
+        print(f"Batch normalization error: {str(e)}")
+        return False
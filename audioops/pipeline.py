@@ -9,15 +9,37 @@ import sys
 import json
 import subprocess
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # 任意: あればJSONの読み込みを高速化
+    orjson = None
+
 # LoudSync関数をインポート
 from .loudsync_legacy import (
-    find_ffmpeg, normalize_audio, measure_loudness,
-    find_audio_files, LoudSyncError
+    find_ffmpeg, normalize_audio, measure_loudness, measure_ebur128,
+    find_audio_files, loudnorm_filter, linear_gain_filter, normalize_batch,
+    measure_loudness_batch,
+    LoudSyncError
+)
+from ._proc import spawn
+from .core import (
+    run, duration_sec, fade_filters, codec_for_output, encoder_args, acrossfade_tree,
+    fade_file, fade_batch, crossfade_sequence, copy_file
 )
-from .core import fade_file, crossfade_sequence
+
+
+# これより多いファイル数では複数ファイルを1つのffmpegプロセスでまとめて正規化
+BATCH_MIN_FILES = 4
+BATCH_SIZE = 16
+
+# ffmpeg間でPCMを渡すパイプの容量（Linuxの既定64KiBから拡張）
+PIPE_BUFFER_SIZE = 1 << 20
+_F_SETPIPE_SZ = 1031
 
 
 class PipelineConfig:
@@ -29,7 +51,11 @@ class PipelineConfig:
             'preset': '-16',  # -16, -18, -19, -20, -23, reffile
             'lufs': -16.0,
             'tp': -1.5,
-            'two_pass': True
+            'two_pass': True,
+            'normalize_mode': 'loudnorm_2pass',  # loudnorm_2pass, linear_gain
+            'measurement': 'loudnorm',  # 2パス時の測定方法: loudnorm, ebur128（高速だが近似）
+            'auto_pass_threshold_sec': 0,  # これより短いファイルは1パス（0 = 常に2パス）
+            'threads_per_job': 2  # ffmpeg 1プロセスあたりのスレッド数
         }
         self.fade = {
             'enabled': False,
@@ -49,7 +75,11 @@ class PipelineConfig:
         }
         self.paths = {
             'ffmpeg': None,  # 自動検出
-            'cache_dir': './_cache'
+            'cache_dir': './_cache',
+            'max_parallel_jobs': 0  # 同時に走らせるffmpeg数（0 = CPU数 / threads_per_job）
+        }
+        self.processing = {
+            'fused_graph': False  # Trueで1回のffmpeg実行で正規化→フェード→連結（中間ファイルなし）
         }
 
 
@@ -78,9 +108,115 @@ def cleanup_cache(cache_dirs: Dict[str, Path], keep_files: bool = False):
             print(f"Cleaned cache: {dir_path}")
 
 
+def parallel_jobs(config: PipelineConfig) -> Tuple[int, int]:
+    """(ffmpeg 1プロセスあたりのスレッド数, 同時実行ジョブ数) を返す"""
+    threads_per_job = max(1, int(config.normalize['threads_per_job']))
+    max_workers = int(config.paths.get('max_parallel_jobs') or 0)
+    if max_workers <= 0:
+        max_workers = (os.cpu_count() or 1) // threads_per_job
+    return threads_per_job, max(1, max_workers)
+
+
+def measure_for_config(file_path: Path, config: PipelineConfig,
+                       ffmpeg_path: str) -> Optional[Dict]:
+    """正規化モードに応じた測定（失敗時はNone = 1パスloudnormにフォールバック）"""
+    threads_per_job, _ = parallel_jobs(config)
+    if config.normalize['normalize_mode'] == 'linear_gain':
+        result = measure_ebur128(str(file_path), ffmpeg_path, threads_per_job)
+    elif config.normalize['two_pass']:
+        # 短いファイルは測定パスを省いて1パスloudnormにする（LRAの誤差が小さいため）
+        threshold = config.normalize.get('auto_pass_threshold_sec') or 0
+        if threshold > 0 and duration_sec(file_path) < threshold:
+            return None
+        result = measure_loudness(
+            str(file_path), ffmpeg_path,
+            config.normalize['lufs'], config.normalize['tp'], threads_per_job,
+            measurement=config.normalize['measurement'])
+    else:
+        return None
+
+    if result['status'] != 'OK':
+        print(f"  Measurement failed for {file_path.name}, "
+              f"falling back to 1-pass")
+        return None
+    return result
+
+
+def normalize_filter(config: PipelineConfig, measured: Optional[Dict]) -> str:
+    """測定結果から正規化フィルタを構築"""
+    if measured is None:
+        return loudnorm_filter(config.normalize['lufs'], config.normalize['tp'])
+    if config.normalize['normalize_mode'] == 'linear_gain':
+        return linear_gain_filter(measured['integrated_lufs'],
+                                  config.normalize['lufs'], config.normalize['tp'])
+    return loudnorm_filter(config.normalize['lufs'], config.normalize['tp'],
+                           measured['raw_json'])
+
+
+def prefetch_measurements(files: List[Path], config: PipelineConfig,
+                          ffmpeg_path: str, max_workers: int):
+    """BATCH_SIZE件ずつ1つのffmpegプロセスで測定し、結果を測定キャッシュに入れる
+
+    以降の measure_for_config はキャッシュから返るので、ファイルごとのffmpeg起動を省ける
+    （バッチで失敗したファイルはキャッシュされず、measure_for_config が個別に再測定する）
+    """
+    if config.normalize['normalize_mode'] == 'linear_gain':
+        measurement = 'ebur128'
+    elif (config.normalize['two_pass']
+          and not config.normalize.get('auto_pass_threshold_sec')):
+        measurement = config.normalize['measurement']
+    else:
+        return  # 測定しない（または長さで1パスに切り替える）設定
+    threads_per_job, _ = parallel_jobs(config)
+
+    def measure_chunk(start: int):
+        measure_loudness_batch(
+            [str(p) for p in files[start:start + BATCH_SIZE]], ffmpeg_path,
+            config.normalize['lufs'], config.normalize['tp'], threads_per_job,
+            measurement=measurement)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(measure_chunk, range(0, len(files), BATCH_SIZE)))
+
+
+@dataclass
+class FileInfoCache:
+    """入力ファイルごとの測定結果と長さ（パイプライン開始時に1回だけ取得し各ステップで共有）"""
+    paths: List[Path]
+    measurements: List[Optional[Dict]]  # 正規化無効・測定失敗・1パス時はNone
+    durations: List[Optional[float]]    # フェード無効時はNone
+
+    def duration_map(self) -> Dict[Path, float]:
+        return {p: d for p, d in zip(self.paths, self.durations) if d is not None}
+
+
+def probe_files(files: List[Path], config: PipelineConfig,
+                ffmpeg_path: str) -> FileInfoCache:
+    """全ファイルの測定と長さ取得を並列で1回だけ行う"""
+    _, max_workers = parallel_jobs(config)
+    if config.normalize['enabled'] and len(files) > BATCH_MIN_FILES:
+        prefetch_measurements(files, config, ffmpeg_path, max_workers)
+
+    def probe_one(file_path: Path) -> Tuple[Optional[Dict], Optional[float]]:
+        measured = None
+        if config.normalize['enabled']:
+            measured = measure_for_config(file_path, config, ffmpeg_path)
+        duration = (source_duration(file_path, measured)
+                    if config.fade['enabled'] else None)
+        return measured, duration
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        probes = list(executor.map(probe_one, files))
+
+    return FileInfoCache(paths=list(files),
+                         measurements=[m for m, _ in probes],
+                         durations=[d for _, d in probes])
+
+
 def run_normalize_step(files: List[Path], config: PipelineConfig,
-                       cache_dirs: Dict[str, Path]) -> List[Path]:
-    """正規化ステップを実行"""
+                       cache_dirs: Dict[str, Path],
+                       info: Optional[FileInfoCache] = None) -> List[Path]:
+    """正規化ステップを実行（info: 事前に取得した測定結果。なければここで測定）"""
     if not config.normalize['enabled']:
         return files
 
@@ -88,38 +224,112 @@ def run_normalize_step(files: List[Path], config: PipelineConfig,
     print(
         f"Target: {config.normalize['lufs']} LUFS / TP {config.normalize['tp']} dBTP")
 
-    normalized_files = []
     ffmpeg_path = config.paths['ffmpeg'] or find_ffmpeg()
+    threads_per_job, max_workers = parallel_jobs(config)
+    if info is None:
+        info = probe_files(files, config, ffmpeg_path)
 
-    for i, file_path in enumerate(files, 1):
-        print(f"[{i}/{len(files)}] Normalizing: {file_path.name}")
+    if len(files) > BATCH_MIN_FILES:
+        return run_normalize_batches(files, config, cache_dirs,
+                                     ffmpeg_path, max_workers, info)
 
+    def normalize_one(idx: int) -> Optional[Path]:
+        file_path = files[idx]
+        measured = info.measurements[idx]
         # 出力ファイル名
         output_name = f"{file_path.stem}__norm{file_path.suffix}"
         output_path = cache_dirs['normalized'] / output_name
 
-        # 正規化実行
+        # 正規化実行（ffmpegはサブプロセスなのでスレッドで並列化できる）
+        # 測定結果がない場合は再測定せず1パスloudnormにする
         success = normalize_audio(
             str(file_path), str(output_path),
             config.normalize['lufs'], config.normalize['tp'],
             config.output['sample_rate'],
             file_path.suffix[1:],  # 拡張子から.を除去
-            config.normalize['two_pass'],
-            ffmpeg_path
+            measured is not None,
+            ffmpeg_path,
+            threads=threads_per_job,
+            mode=(config.normalize['normalize_mode']
+                  if measured is not None else 'loudnorm_2pass'),
+            measured=measured
         )
+        return output_path if success else None
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(normalize_one, idx): idx
+                   for idx in range(len(files))}
+
+        for done, future in enumerate(as_completed(futures), 1):
+            idx = futures[future]
+            print(f"[{done}/{len(files)}] {files[idx].name}")
+            output_path = future.result()
+            if output_path is not None:
+                results.append((idx, output_path))
+                print(f"  ✓ Normalized to: {output_path.name}")
+            else:
+                print(f"  ✗ Normalization failed, skipping")
+
+    # 入力順を維持
+    results.sort()
+    normalized_files = [output_path for _, output_path in results]
+
+    return normalized_files
+
 
-        if success:
-            normalized_files.append(output_path)
-            print(f"  ✓ Normalized to: {output_path.name}")
+def run_normalize_batches(files: List[Path], config: PipelineConfig,
+                          cache_dirs: Dict[str, Path], ffmpeg_path: str,
+                          max_workers: int, info: FileInfoCache) -> List[Path]:
+    """BATCH_SIZE件ずつ1つのffmpegプロセスで正規化（起動コストを償却）"""
+    threads_per_job, _ = parallel_jobs(config)
+    output_paths = [cache_dirs['normalized'] / f"{p.stem}__norm{p.suffix}"
+                    for p in files]
+    measurements = info.measurements
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def normalize_chunk(start: int) -> List[int]:
+            idxs = range(start, min(start + BATCH_SIZE, len(files)))
+            success = normalize_batch(
+                [str(files[i]) for i in idxs],
+                [str(output_paths[i]) for i in idxs],
+                [normalize_filter(config, measurements[i]) for i in idxs],
+                config.output['sample_rate'],
+                ffmpeg_path=ffmpeg_path,
+                threads=threads_per_job
+            )
+            if success:
+                return list(idxs)
+
+            # バッチ失敗時はファイル単位にフォールバック
+            # （測定結果がない = 短いファイル等は再測定せず1パスloudnormにする）
+            return [i for i in idxs if normalize_audio(
+                str(files[i]), str(output_paths[i]),
+                config.normalize['lufs'], config.normalize['tp'],
+                config.output['sample_rate'], files[i].suffix[1:],
+                measurements[i] is not None, ffmpeg_path,
+                threads=threads_per_job,
+                mode=(config.normalize['normalize_mode']
+                      if measurements[i] is not None else 'loudnorm_2pass'),
+                measured=measurements[i])]
+
+        succeeded = set()
+        for idxs in executor.map(normalize_chunk, range(0, len(files), BATCH_SIZE)):
+            succeeded.update(idxs)
+
+    for i, file_path in enumerate(files):
+        if i in succeeded:
+            print(f"  ✓ Normalized to: {output_paths[i].name}")
         else:
-            print(f"  ✗ Normalization failed, skipping")
+            print(f"  ✗ Normalization failed, skipping: {file_path.name}")
 
-    return normalized_files
+    return [output_paths[i] for i in range(len(files)) if i in succeeded]
 
 
 def run_fade_step(files: List[Path], config: PipelineConfig,
-                  cache_dirs: Dict[str, Path]) -> List[Path]:
-    """フェードステップを実行"""
+                  cache_dirs: Dict[str, Path],
+                  durations: Optional[Dict[Path, float]] = None) -> List[Path]:
+    """フェードステップを実行（durations: 既知の長さ。あればffprobeを省略）"""
     if not config.fade['enabled'] or not files:
         return files
 
@@ -127,29 +337,175 @@ def run_fade_step(files: List[Path], config: PipelineConfig,
     print(f"FadeIn: {config.fade['in_ms']}ms, FadeOut: {config.fade['out_ms']}ms "
           f"(from end: {config.fade['from_end_sec']}s)")
 
-    faded_files = []
+    threads_per_job, max_workers = parallel_jobs(config)
+    durations = durations or {}
+    fade_args = dict(
+        fade_in_ms=config.fade['in_ms'],
+        fade_out_ms=config.fade['out_ms'],
+        fade_out_from_end_sec=config.fade['from_end_sec'],
+        codec=config.output['codec'],
+        ffmpeg_path=config.paths['ffmpeg'],
+        threads=threads_per_job
+    )
+    # 出力ファイル名
+    output_paths = [cache_dirs['faded'] / f"{p.stem}__fade{p.suffix}" for p in files]
+
+    def fade_one(idx: int) -> Path:
+        fade_file(files[idx], output_paths[idx],
+                  duration_sec_hint=durations.get(files[idx]), **fade_args)
+        return output_paths[idx]
+
+    def fade_chunk(idxs: List[int]) -> List[Tuple[int, object]]:
+        # 複数ファイルは1つのffmpegプロセスでまとめてフェード（失敗時は1件ずつ）
+        if len(idxs) > 1:
+            try:
+                fade_batch([files[i] for i in idxs], [output_paths[i] for i in idxs],
+                           durations=[durations.get(files[i]) or duration_sec(files[i])
+                                      for i in idxs],
+                           **fade_args)
+                return [(i, output_paths[i]) for i in idxs]
+            except Exception as e:
+                print(f"  Batch fade failed, falling back to per-file: {e}")
+        results = []
+        for i in idxs:
+            try:
+                results.append((i, fade_one(i)))
+            except Exception as e:
+                results.append((i, e))
+        return results
+
+    # PCM WAVはfade_fileがffmpegを起動せずPython内で処理する（CPU処理なのでGILを避けて
+    # プロセスプールで並列化）。それ以外は同じ拡張子ごとにBATCH_SIZE件ずつまとめる
+    wav_idxs = [i for i, p in enumerate(files) if p.suffix.lower() == '.wav']
+    chunks = []
+    by_suffix: Dict[str, List[int]] = {}
+    for i, p in enumerate(files):
+        if p.suffix.lower() != '.wav':
+            by_suffix.setdefault(p.suffix.lower(), []).append(i)
+    for idxs in by_suffix.values():
+        chunks.extend(idxs[start:start + BATCH_SIZE]
+                      for start in range(0, len(idxs), BATCH_SIZE))
+
+    results = []
+    done = 0
+    # ProcessPoolExecutorはsubmitされるまでワーカーを起動しない
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            ProcessPoolExecutor(max_workers=max(1, min(max_workers, len(wav_idxs)))) as processes:
+        # value: WAVのインデックス（プロセスプール側）/ None（fade_chunkの結果リスト）
+        futures = {processes.submit(fade_file, files[i], output_paths[i],
+                                    duration_sec_hint=durations.get(files[i]),
+                                    **fade_args): i
+                   for i in wav_idxs}
+        futures.update((executor.submit(fade_chunk, idxs), None) for idxs in chunks)
+
+        for future in as_completed(futures):
+            idx = futures[future]
+            if idx is not None:
+                chunk_results = [(idx, future.exception() or output_paths[idx])]
+            else:
+                chunk_results = future.result()
+            for idx, output_path in chunk_results:
+                done += 1
+                print(f"[{done}/{len(files)}] Adding fade: {files[idx].name}")
+                if isinstance(output_path, Exception):
+                    print(f"  ✗ Fade failed: {output_path}")
+                else:
+                    results.append((idx, output_path))
+                    print(f"  ✓ Faded to: {output_path.name}")
+
+    # 入力順を維持
+    results.sort()
+    return [output_path for _, output_path in results]
+
+
+def source_duration(file_path: Path, measured: Optional[Dict]) -> float:
+    """測定パスのffmpeg出力から得た長さを優先し、なければffprobe"""
+    if measured and measured.get('duration_sec'):
+        return measured['duration_sec']
+    return duration_sec(file_path)
+
+
+def _grow_pipe(pipe):
+    """パイプ容量を広げ、送り側・受け側ffmpegの細かい書き込み/読み込みの往復を減らす"""
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        import fcntl
+        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+    except OSError:
+        pass  # pipe-max-sizeを超える場合などは既定の容量のまま
 
-    for i, file_path in enumerate(files, 1):
-        print(f"[{i}/{len(files)}] Adding fade: {file_path.name}")
 
-        # 出力ファイル名
+def normalize_fade_stream(file_path: Path, output_path: Path,
+                          config: PipelineConfig, measured: Optional[Dict],
+                          duration: float) -> None:
+    """正規化ffmpegの出力をパイプでフェードffmpegへ直接渡す（中間WAVなし）"""
+    ffmpeg_path = config.paths['ffmpeg'] or find_ffmpeg()
+    threads_per_job, _ = parallel_jobs(config)
+
+    producer = spawn(
+        [ffmpeg_path, '-hide_banner', '-nostats', '-loglevel', 'error',
+         '-i', str(file_path),
+         '-af', normalize_filter(config, measured),
+         '-ar', str(config.output['sample_rate']),
+         '-threads', str(threads_per_job),
+         '-c:a', 'pcm_f32le', '-f', 'wav', 'pipe:1'],
+        stdout=subprocess.PIPE)
+    _grow_pipe(producer.stdout)
+    try:
+        fade_file(
+            "-", output_path,
+            fade_in_ms=config.fade['in_ms'],
+            fade_out_ms=config.fade['out_ms'],
+            fade_out_from_end_sec=config.fade['from_end_sec'],
+            codec=config.output['codec'],
+            ffmpeg_path=ffmpeg_path,
+            duration_sec_hint=duration,
+            stdin=producer.stdout,
+            threads=threads_per_job
+        )
+    finally:
+        producer.stdout.close()
+        producer.wait()
+    if producer.returncode != 0:
+        raise LoudSyncError(f"Normalization failed for {file_path.name}")
+
+
+def run_normalize_fade_step(files: List[Path], config: PipelineConfig,
+                            cache_dirs: Dict[str, Path],
+                            info: Optional[FileInfoCache] = None) -> List[Path]:
+    """正規化→フェードをパイプで連結して実行"""
+    print(f"=== Normalize + Fade Step (piped) ===")
+    threads_per_job, max_workers = parallel_jobs(config)
+    if info is None:
+        info = probe_files(files, config, config.paths['ffmpeg'] or find_ffmpeg())
+
+    def process_one(idx: int) -> Path:
+        file_path = files[idx]
         output_name = f"{file_path.stem}__fade{file_path.suffix}"
         output_path = cache_dirs['faded'] / output_name
-
-        try:
-            fade_file(
-                file_path, output_path,
-                fade_in_ms=config.fade['in_ms'],
-                fade_out_ms=config.fade['out_ms'],
-                fade_out_from_end_sec=config.fade['from_end_sec'],
-                codec=config.output['codec']
-            )
-            faded_files.append(output_path)
-            print(f"  ✓ Faded to: {output_path.name}")
-        except Exception as e:
-            print(f"  ✗ Fade failed: {e}")
-
-    return faded_files
+        normalize_fade_stream(file_path, output_path, config,
+                              info.measurements[idx], info.durations[idx])
+        return output_path
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(process_one, idx): idx
+                   for idx in range(len(files))}
+
+        for done, future in enumerate(as_completed(futures), 1):
+            idx = futures[future]
+            print(f"[{done}/{len(files)}] {files[idx].name}")
+            try:
+                output_path = future.result()
+                results.append((idx, output_path))
+                print(f"  ✓ Processed to: {output_path.name}")
+            except Exception as e:
+                print(f"  ✗ Processing failed: {e}")
+
+    # 入力順を維持
+    results.sort()
+    return [output_path for _, output_path in results]
 
 
 def run_crossfade_step(files: List[Path], config: PipelineConfig,
@@ -158,7 +514,7 @@ def run_crossfade_step(files: List[Path], config: PipelineConfig,
     if not config.crossfade['enabled'] or len(files) < 2:
         if len(files) == 1:
             # 単一ファイルの場合はコピー
-            shutil.copy2(files[0], output_path)
+            copy_file(files[0], output_path)
             print(f"Single file copied to: {output_path}")
             return True
         return False
@@ -173,7 +529,8 @@ def run_crossfade_step(files: List[Path], config: PipelineConfig,
             overlap_sec=config.crossfade['overlap_sec'],
             curve1=config.crossfade['curve'],
             curve2=config.crossfade['curve'],
-            codec=config.output['codec']
+            codec=config.output['codec'],
+            ffmpeg_path=config.paths['ffmpeg']
         )
         print(f"✓ Crossfaded to: {output_path}")
         return True
@@ -182,6 +539,72 @@ def run_crossfade_step(files: List[Path], config: PipelineConfig,
         return False
 
 
+def build_input_chain(config: PipelineConfig, measured: Optional[Dict],
+                      duration: Optional[float]) -> str:
+    """1入力分のフィルタチェーン（loudnorm→afade）を構築"""
+    filters = []
+    if config.normalize['enabled']:
+        filters.append(normalize_filter(config, measured))
+    # loudnorm/alimiterは192kHzで動作するため、連結前にレートを揃える
+    filters.append(f"aresample={config.output['sample_rate']}")
+    if config.fade['enabled']:
+        filters.extend(fade_filters(
+            duration,
+            fade_in_ms=config.fade['in_ms'],
+            fade_out_ms=config.fade['out_ms'],
+            fade_out_from_end_sec=config.fade['from_end_sec']
+        ))
+    return ",".join(filters)
+
+
+def run_fused_step(files: List[Path], config: PipelineConfig,
+                   output_path: Path,
+                   info: Optional[FileInfoCache] = None) -> bool:
+    """正規化→フェード→クロスフェードを単一の-filter_complexで実行"""
+    if not files:
+        print("No files to process")
+        return False
+    if len(files) > 1 and not config.crossfade['enabled']:
+        print("Multiple files require crossfade to produce a single output")
+        return False
+
+    print(f"=== Fused Step ===")
+    ffmpeg_path = config.paths['ffmpeg'] or find_ffmpeg()
+
+    # 測定パス（2パス正規化のmeasured_*値とフェード位置計算用の長さ）
+    if info is None:
+        info = probe_files(files, config, ffmpeg_path)
+
+    # 入力ごとのチェーン [i:a]...[ai]
+    chains = []
+    for i, (measured, duration) in enumerate(zip(info.measurements, info.durations)):
+        chains.append(
+            f"[{i}:a]{build_input_chain(config, measured, duration)}[a{i}]")
+
+    # クロスフェード連結（隣接ペアから二分木で畳み込む）
+    crossfade_chains, out = acrossfade_tree(
+        [f"[a{i}]" for i in range(len(files))],
+        config.crossfade['overlap_sec'],
+        config.crossfade['curve'], config.crossfade['curve'])
+    chains += crossfade_chains
+
+    args = [ffmpeg_path, "-hide_banner", "-y"]
+    for p in files:
+        args += ["-i", str(p)]
+    args += ["-filter_complex", ";".join(chains),
+             "-map", out, "-ar", str(config.output['sample_rate']),
+             *encoder_args(codec_for_output(output_path, config.output['codec'])),
+             str(output_path)]
+
+    try:
+        run(args)
+        print(f"✓ Processed to: {output_path}")
+        return True
+    except Exception as e:
+        print(f"✗ Fused processing failed: {e}")
+        return False
+
+
 def run_pipeline(input_files: List[Path], output_path: Path,
                  config: PipelineConfig) -> bool:
     """パイプライン全体を実行"""
@@ -190,19 +613,50 @@ def run_pipeline(input_files: List[Path], output_path: Path,
         print(f"Input files: {len(input_files)}")
         print(f"Output: {output_path}")
 
+        # ffmpegは1回だけ解決して各ステップへ伝播
+        if not config.paths['ffmpeg']:
+            config.paths['ffmpeg'] = find_ffmpeg()
+
+        # 測定・長さ取得は全ステップ分をここで1回だけ行う
+        info = probe_files(input_files, config, config.paths['ffmpeg'])
+
+        # 入力が1つならクロスフェードがないので、キャッシュへの中間ファイル書き出しと
+        # 最終コピーをせずに1回のffmpegで入力から出力まで直接処理する
+        single_pass = (len(input_files) == 1
+                       and (config.normalize['enabled'] or config.fade['enabled']))
+
+        if config.processing['fused_graph'] or single_pass:
+            final_success = run_fused_step(input_files, config, output_path, info)
+            if final_success:
+                print(f"=== Pipeline Completed Successfully ===")
+                print(f"Output: {output_path}")
+            else:
+                print(f"=== Pipeline Failed ===")
+            return final_success
+
         # キャッシュディレクトリ設定
         cache_dirs = setup_cache_dirs(config.paths['cache_dir'])
 
-        # ステップ1: 正規化
-        normalized_files = run_normalize_step(input_files, config, cache_dirs)
-        if not normalized_files:
-            print("No files to process after normalization")
-            return False
-
-        # ステップ2: フェード
-        faded_files = run_fade_step(normalized_files, config, cache_dirs)
-        if not faded_files:
-            faded_files = normalized_files  # フェードなしの場合は正規化済みファイルを使用
+        if config.normalize['enabled'] and config.fade['enabled']:
+            # ステップ1+2: 正規化→フェード（パイプ連結、中間WAVなし）
+            faded_files = run_normalize_fade_step(
+                input_files, config, cache_dirs, info)
+            if not faded_files:
+                print("No files to process after normalization")
+                return False
+        else:
+            # ステップ1: 正規化
+            normalized_files = run_normalize_step(
+                input_files, config, cache_dirs, info)
+            if not normalized_files:
+                print("No files to process after normalization")
+                return False
+
+            # ステップ2: フェード
+            faded_files = run_fade_step(normalized_files, config, cache_dirs,
+                                        info.duration_map())
+            if not faded_files:
+                faded_files = normalized_files  # フェードなしの場合は正規化済みファイルを使用
 
         # ステップ3: クロスフェード（または単一ファイルコピー）
         final_success = run_crossfade_step(faded_files, config, output_path)
@@ -292,7 +746,8 @@ def save_config(config: PipelineConfig, config_path: str):
         'fade': config.fade,
         'crossfade': config.crossfade,
         'output': config.output,
-        'paths': config.paths
+        'paths': config.paths,
+        'processing': config.processing
     }
 
     with open(config_path, 'w', encoding='utf-8') as f:
@@ -309,14 +764,18 @@ def load_config(config_path: str) -> PipelineConfig:
         return config
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_dict = json.load(f)
+        if orjson is not None:
+            config_dict = orjson.loads(Path(config_path).read_bytes())
+        else:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config_dict = json.load(f)
 
         config.normalize.update(config_dict.get('normalize', {}))
         config.fade.update(config_dict.get('fade', {}))
         config.crossfade.update(config_dict.get('crossfade', {}))
         config.output.update(config_dict.get('output', {}))
         config.paths.update(config_dict.get('paths', {}))
+        config.processing.update(config_dict.get('processing', {}))
 
         print(f"Configuration loaded from: {config_path}")
 
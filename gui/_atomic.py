@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+設定ファイル等のアトミックな書き込み
+同じディレクトリの一時ファイルに書いてから os.replace で置き換えるので、
+書き込み途中で落ちても元のファイルが壊れた状態で残らない
+"""
+
+import os
+import json
+
+
+def write_bytes_atomic(path, data: bytes):
+    """data を path にアトミックに書き込む"""
+    path = os.fspath(path)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def dump_json_atomic(path, obj, indent: bool = True):
+    """obj をJSON(UTF-8)として path にアトミックに書き込む（orjsonがあれば使用）"""
+    try:
+        import orjson
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, option=option)
+    except ImportError:
+        data = json.dumps(obj, ensure_ascii=False,
+                          indent=2 if indent else None).encode('utf-8')
+    write_bytes_atomic(path, data)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+フォルダ単位のラウドネス測定結果キャッシュ
+出力フォルダの .loudsync_cache.json に保存し、同じフォルダを再測定する際は
+内容が変わっていない（パス・サイズ・更新時刻が一致する）ファイルのffmpeg測定を省略する
+"""
+
+import json
+from pathlib import Path
+
+from audioops.loudsync_legacy import measurement_cache_entries, restore_measurement_cache
+from gui._atomic import dump_json_atomic
+
+CACHE_NAME = ".loudsync_cache.json"
+
+
+def load_measure_cache(output_dir) -> None:
+    """output_dir のキャッシュを測定キャッシュへ読み込む（なければ何もしない）"""
+    try:
+        with open(Path(output_dir) / CACHE_NAME, 'r', encoding='utf-8') as f:
+            restore_measurement_cache(json.load(f))
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def save_measure_cache(output_dir, files) -> None:
+    """files（今回測定したファイル）の測定結果だけを output_dir に保存
+    （他のフォルダや以前の実行の結果まで書き出してファイルが肥大化しないように）"""
+    dump_json_atomic(Path(output_dir) / CACHE_NAME, measurement_cache_entries(files),
+                     indent=False)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+参照ファイルのラウドネス測定結果キャッシュ
+(パス, サイズ, 更新時刻) をキーに ~/.loudsync/ref_cache.json へ保存し、
+同じ参照ファイルを使う2回目以降の実行ではffmpegでの測定を省略する
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from audioops.loudsync_legacy import measure_loudness, LoudSyncError
+from gui._atomic import dump_json_atomic
+
+CACHE_PATH = Path.home() / ".loudsync" / "ref_cache.json"
+
+_cache: Optional[Dict[str, float]] = None  # 初回アクセス時に読み込み
+_lock = threading.Lock()
+
+
+def _cache_key(path: str) -> str:
+    st = os.stat(path)
+    return f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _load() -> Dict[str, float]:
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save():
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    dump_json_atomic(CACHE_PATH, _cache, indent=False)
+
+
+def get_cached_lufs(path: str, ffmpeg_path: str) -> float:
+    """参照ファイルの積分ラウドネス(LUFS)を返す（キャッシュになければ測定して保存）"""
+    key = _cache_key(path)
+    with _lock:
+        cache = _load()
+        if key in cache:
+            return cache[key]
+
+    result = measure_loudness(path, ffmpeg_path)
+    if result['status'] != 'OK':
+        raise LoudSyncError(result['status'])
+
+    with _lock:
+        _load()[key] = result['integrated_lufs']
+        _save()
+    return result['integrated_lufs']
+
+
+def clear_ref_cache():
+    """キャッシュを全て削除"""
+    global _cache
+    with _lock:
+        _cache = {}
+        try:
+            CACHE_PATH.unlink()
+        except FileNotFoundError:
+            pass
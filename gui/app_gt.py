@@ -3,8 +3,9 @@ from PySide6.QtWidgets import (
     QListWidget, QPushButton, QFileDialog, QHBoxLayout, QSpinBox, QLabel,
     QAbstractItemView
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QRunnable, QThreadPool
 from pathlib import Path
+import os
 import sys
 from audioops.core import fade_file, crossfade_sequence
 
@@ -30,20 +31,23 @@ class DropList(QListWidget):
         e.acceptProposedAction()
 
 
-class Worker(QThread):
-    finished = Signal(str)
-    errored = Signal(str)
+class JobRunnable(QRunnable):
+    """QThreadPool上で1ジョブ（1ファイル分の処理など）を実行"""
 
     def __init__(self, fn, *args, **kwargs):
         super().__init__()
         self.fn, self.args, self.kwargs = fn, args, kwargs
 
     def run(self):
-        try:
-            self.fn(*self.args, **self.kwargs)
-            self.finished.emit("done")
-        except Exception as ex:
-            self.errored.emit(str(ex))
+        self.fn(*self.args, **self.kwargs)
+
+
+def start_job(fn, *args, **kwargs):
+    """fnをグローバルなQThreadPoolに投入
+    ffmpeg自体もマルチスレッドなので同時実行数はCPU数の半分に抑える"""
+    pool = QThreadPool.globalInstance()
+    pool.setMaxThreadCount(max(1, (os.cpu_count() or 2) // 2))
+    pool.start(JobRunnable(fn, *args, **kwargs))
 
 
 class FadeTab(QWidget):
@@ -90,14 +94,13 @@ class FadeTab(QWidget):
         in_ms, out_ms, from_end = self.in_ms.value(
         ), self.out_ms.value(), self.from_end.value()
 
-        def task():
-            for i in range(self.list.count()):
-                src = Path(self.list.item(i).text())
-                dst = Path(out_dir) / src.with_suffix(src.suffix).name
-                fade_file(src, dst, fade_in_ms=in_ms, fade_out_ms=out_ms,
-                          fade_out_from_end_sec=from_end, codec="libmp3lame")
-        self.worker = Worker(task)
-        self.worker.start()
+        # 1ファイル = 1ジョブとしてスレッドプールに投入
+        for i in range(self.list.count()):
+            src = Path(self.list.item(i).text())
+            dst = Path(out_dir) / src.with_suffix(src.suffix).name
+            start_job(fade_file, src, dst, fade_in_ms=in_ms,
+                      fade_out_ms=out_ms, fade_out_from_end_sec=from_end,
+                      codec="libmp3lame")
 
 
 class CrossfadeTab(QWidget):
@@ -136,9 +139,8 @@ class CrossfadeTab(QWidget):
         files = [Path(self.list.item(i).text())
                  for i in range(self.list.count())]
         ov = self.overlap.value()
-        self.worker = Worker(crossfade_sequence, files, Path(
-            out_path), ov, "tri", "tri", "libmp3lame")
-        self.worker.start()
+        start_job(crossfade_sequence, files, Path(out_path), ov,
+                  "tri", "tri", "libmp3lame")
 
 
 class NormalizeTab(QWidget):
@@ -5,38 +5,102 @@ LoudSync Suite GUI - PySide6ベースのタブ分割GUI
 フェード・クロスフェード統合インターフェース
 """
 
-from audioops.pipeline import (
-    PipelineConfig, run_pipeline, create_preset_config,
-    save_config, load_config
-)
-from audioops.core import fade_file, crossfade_sequence, duration_sec
-import sys
-import os
-import json
-import shutil
-from pathlib import Path
-from typing import List, Dict, Optional
-
 import os
 import sys
 import json
-import shutil
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 import logging
+import logging.handlers
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 
+# audioops モジュールをインポートできるようにする（audioops本体は使用時に遅延インポート）
+sys.path.append(str(Path(__file__).parent.parent))
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QPushButton, QFileDialog, QSpinBox, QDoubleSpinBox, QLabel,
-    QAbstractItemView, QComboBox, QCheckBox, QTextEdit, QProgressBar,
+    QAbstractItemView, QComboBox, QCheckBox, QPlainTextEdit, QProgressBar,
     QStatusBar, QGroupBox, QFormLayout, QMessageBox, QSplitter, QRadioButton
 )
-from PySide6.QtCore import Qt, QThread, Signal, QMimeData
+from PySide6.QtCore import (
+    Qt, QObject, Signal, QMimeData, QRunnable, QThreadPool, QTimer
+)
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 
-# audioops モジュールをインポート
-sys.path.append(str(Path(__file__).parent.parent))
+# 対応する音声ファイルの拡張子
+AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.m4a', '.flac'})
+
+# 正規化プリセット（コンボボックスの並び順）: (表示名, ターゲットLUFS, パイプラインのプリセット名)
+NORMALIZE_PRESETS = (
+    ("ポッドキャスト (-16 LUFS)", -16.0, "podcast"),
+    ("BGM (-18 LUFS)", -18.0, "bgm"),
+    ("BGM (-19 LUFS)", -19.0, "bgm"),
+    ("BGM (-20 LUFS)", -20.0, "bgm"),
+    ("放送 (-23 LUFS)", -23.0, "broadcast"),
+)
+# 固定プリセットの後ろに置く「参照ファイル」のインデックス
+REFERENCE_PRESET_INDEX = len(NORMALIZE_PRESETS)
+# 正規化時のTrue Peak上限(dBTP)
+NORMALIZE_TARGET_TP = -2.0
+
+
+@lru_cache(maxsize=16)
+def _read_config(path: str, mtime_ns: int) -> dict:
+    """設定JSONを読み込む（mtimeをキーに含めるので、ファイル更新時は読み直す）
+    戻り値はキャッシュと共有されるため変更しないこと"""
+    data = Path(path).read_bytes()
+    try:
+        import orjson
+        return orjson.loads(data)
+    except ImportError:
+        return json.loads(data.decode('utf-8'))
+
+
+def _sidecar_path(output_file: Path) -> Path:
+    return output_file.with_name(output_file.name + '.loudsync.json')
+
+
+def existing_names(directory: Path) -> Optional[Set[str]]:
+    """ディレクトリ内のファイル名を1回の列挙で取得（読めなければNone）"""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return None
+
+
+def is_output_up_to_date(src: Path, output_file: Path, params: dict,
+                         existing: Optional[Set[str]] = None) -> bool:
+    """出力が入力より新しく、同じ設定(params)で作られたものならTrue
+
+    existing に出力先のファイル名一覧を渡すと、未出力のファイルは stat せずに判定する
+    """
+    if existing is not None and output_file.name not in existing:
+        return False
+    try:
+        if output_file.stat().st_mtime_ns < src.stat().st_mtime_ns:
+            return False
+        with open(_sidecar_path(output_file), 'rb') as f:
+            return json.load(f) == params
+    except (OSError, ValueError):
+        return False
+
+
+def write_output_sidecar(output_file: Path, params: dict):
+    """出力を作った設定を {出力ファイル}.loudsync.json に記録"""
+    from gui._atomic import dump_json_atomic
+    try:
+        dump_json_atomic(_sidecar_path(output_file), params, indent=False)
+    except OSError:
+        pass  # 記録できなくても次回再エンコードされるだけ
 
 
 class DropListWidget(QListWidget):
@@ -48,6 +112,22 @@ class DropListWidget(QListWidget):
         self.setDragDropMode(QAbstractItemView.InternalMove)
         self.setDefaultDropAction(Qt.MoveAction)
 
+        # files() の結果をキャッシュし、リストが変化したら破棄する
+        self._files: Optional[List[Path]] = None
+        model = self.model()
+        for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                       model.dataChanged, model.modelReset, model.layoutChanged):
+            signal.connect(self._invalidate_files)
+
+    def _invalidate_files(self, *args):
+        self._files = None
+
+    def files(self) -> List[Path]:
+        """リスト中のファイルを表示順で返す（変化がなければ前回の結果を再利用）"""
+        if self._files is None:
+            self._files = [Path(self.item(i).text()) for i in range(self.count())]
+        return list(self._files)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -62,38 +142,140 @@ class DropListWidget(QListWidget):
 
     def dropEvent(self, event: QDropEvent):
         if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = Path(url.toLocalFile())
-                if file_path.is_file() and file_path.suffix.lower() in ['.wav', '.mp3', '.m4a', '.flac']:
-                    self.addItem(str(file_path))
+            # 拡張子で先に絞り込んでからis_file()を確認し、まとめて追加
+            items = [str(file_path) for url in event.mimeData().urls()
+                     if (file_path := Path(url.toLocalFile())).suffix.lower() in AUDIO_EXTENSIONS
+                     and file_path.is_file()]
+            self.add_paths(items)
             event.acceptProposedAction()
         else:
             super().dropEvent(event)
 
+    def add_paths(self, paths: List[str]):
+        """複数パスを1回のaddItemsで追加（途中の再描画を抑止）"""
+        if not paths:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            self.addItems(paths)
+        finally:
+            self.setUpdatesEnabled(True)
+
 
-class ProcessWorker(QThread):
-    """処理用ワーカースレッド"""
+class ProcessWorkerSignals(QObject):
+    """ProcessWorkerのシグナル（QRunnableはQObjectではないため別に持つ）"""
 
     finished = Signal(bool, str)  # success, message
     progress = Signal(str)  # progress message
     error = Signal(str)  # error message
 
+
+class ProcessWorker(QRunnable):
+    """処理用ワーカー（専用スレッドを作らずQThreadPool上で実行）"""
+
     def __init__(self, task_func, *args, **kwargs):
         super().__init__()
+        self.signals = ProcessWorkerSignals()
         self.task_func = task_func
         self.args = args
         self.kwargs = kwargs
 
+    def start(self):
+        QThreadPool.globalInstance().start(self)
+
     def run(self):
         try:
             result = self.task_func(*self.args, **self.kwargs)
             if result:
-                self.finished.emit(True, "処理が正常に完了しました")
+                self.signals.finished.emit(True, "処理が正常に完了しました")
             else:
-                self.finished.emit(False, "処理中にエラーが発生しました")
+                self.signals.finished.emit(False, "処理中にエラーが発生しました")
+        except Exception as e:
+            self.signals.error.emit(f"処理エラー: {str(e)}")
+            self.signals.finished.emit(False, str(e))
+
+
+class FutureRunnable(QRunnable):
+    """QThreadPool上でfnを実行し、結果をconcurrent.futures.Futureに設定"""
+
+    def __init__(self, future: Future, fn, *args):
+        super().__init__()
+        self.future = future
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            self.future.set_result(self.fn(*self.args))
         except Exception as e:
-            self.error.emit(f"処理エラー: {str(e)}")
-            self.finished.emit(False, str(e))
+            self.future.set_exception(e)
+
+
+def submit_to_pool(fn, *args) -> Future:
+    """fn(*args) をQThreadPoolに投入し、結果を受け取るFutureを返す"""
+    future = Future()
+    QThreadPool.globalInstance().start(FutureRunnable(future, fn, *args))
+    return future
+
+
+class BatchedLog:
+    """ワーカー側でログ行をまとめ、MAX_LINES行またはINTERVAL_SEC秒ごとにGUIへ送る
+    （複数のプールスレッドから同時に呼ばれてもよい）"""
+
+    MAX_LINES = 32
+    INTERVAL_SEC = 0.2
+
+    def __init__(self, main_window):
+        self.main_window = main_window
+        self.lines = []
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    def __call__(self, message: str):
+        with self.lock:
+            self.lines.append(message)
+            if (len(self.lines) < self.MAX_LINES
+                    and time.monotonic() - self.last_flush < self.INTERVAL_SEC):
+                return
+            lines, self.lines = self.lines, []
+            self.last_flush = time.monotonic()
+        self.main_window.log_messages(lines)
+
+    def flush(self):
+        with self.lock:
+            lines, self.lines = self.lines, []
+            self.last_flush = time.monotonic()
+        if lines:
+            self.main_window.log_messages(lines)
+
+
+def wait_futures(futures: List[Future]):
+    """Futureの完了を待つ
+    （呼び出し元もプールのスレッドなので、待機中はその枠を譲って投入済みの処理を進める）"""
+    pool = QThreadPool.globalInstance()
+    pool.releaseThread()
+    try:
+        wait(futures)
+    finally:
+        pool.reserveThread()
+
+
+def pool_ffmpeg_threads(n_jobs: int) -> int:
+    """n_jobs件をQThreadPoolで同時実行するときのffmpeg 1プロセスあたりのスレッド数"""
+    from audioops.loudsync_legacy import threads_per_invocation
+    return threads_per_invocation(
+        min(n_jobs, QThreadPool.globalInstance().maxThreadCount()))
+
+
+def run_files_in_pool(fn, files: List[Path]) -> list:
+    """fn(index, file_path) を全ファイル分QThreadPoolで並列実行し、入力順の結果を返す
+    （ffmpegはサブプロセスなので、スレッドはその待ち合わせに使われるだけ）"""
+    futures = [submit_to_pool(fn, i, file_path) for i, file_path in enumerate(files)]
+    wait_futures(futures)
+    # 例外は結果として返す（呼び出し側でファイル単位に扱う）
+    return [f.exception() or f.result() for f in futures]
 
 
 class NormalizeTab(QWidget):
@@ -102,8 +284,20 @@ class NormalizeTab(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        self._loading = False  # 設定復元中はモード・プリセット変更の反映を保留
         self.setup_ui()
 
+    @contextmanager
+    def restoring(self):
+        """設定復元中の途中状態では表示を切り替えず、終了時に1回だけ反映"""
+        self._loading = True
+        try:
+            yield
+        finally:
+            self._loading = False
+        self.on_mode_changed()
+        self.on_preset_changed()
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
 
@@ -146,14 +340,8 @@ class NormalizeTab(QWidget):
         settings_layout = QFormLayout(self.settings_group)
 
         self.preset_combo = QComboBox()
-        self.preset_combo.addItems([
-            "ポッドキャスト (-16 LUFS)",
-            "BGM (-18 LUFS)",
-            "BGM (-19 LUFS)",
-            "BGM (-20 LUFS)",
-            "放送 (-23 LUFS)",
-            "参照ファイル"
-        ])
+        self.preset_combo.addItems(
+            [label for label, _, _ in NORMALIZE_PRESETS] + ["参照ファイル"])
         self.preset_combo.currentIndexChanged.connect(self.on_preset_changed)
         settings_layout.addRow("プリセット:", self.preset_combo)
 
@@ -162,15 +350,23 @@ class NormalizeTab(QWidget):
         btn_reference_file = QPushButton("選択")
         btn_reference_file.clicked.connect(self.select_reference_file)
 
+        # 参照ファイルの測定結果キャッシュを削除
+        btn_clear_ref_cache = QPushButton("キャッシュ削除")
+        btn_clear_ref_cache.clicked.connect(self.clear_reference_cache)
+
         self.reference_file_layout = QHBoxLayout()
         self.reference_file_layout.addWidget(self.reference_file_edit)
         self.reference_file_layout.addWidget(btn_reference_file)
+        self.reference_file_layout.addWidget(btn_clear_ref_cache)
 
         self.reference_file_widget = QWidget()
         self.reference_file_widget.setLayout(self.reference_file_layout)
 
         settings_layout.addRow("参照ファイル:", self.reference_file_widget)
-        self.reference_file_form_row = settings_layout.rowCount() - 1
+        # 行の表示切替用に（ラベル, フィールド）を保持
+        self.reference_file_row = (
+            settings_layout.labelForField(self.reference_file_widget),
+            self.reference_file_widget)
 
         self.format_combo = QComboBox()
         self.format_combo.addItems(["WAV", "MP3", "M4A"])
@@ -185,6 +381,16 @@ class NormalizeTab(QWidget):
         self.two_pass_check.setChecked(True)
         settings_layout.addRow("オプション:", self.two_pass_check)
 
+        # 多数の短いファイル向け：複数ファイルを1つのffmpegプロセスで処理
+        self.batch_check = QCheckBox("バッチ処理（複数ファイルをまとめてffmpeg 1回で処理）")
+        self.batch_check.setChecked(False)
+        settings_layout.addRow("", self.batch_check)
+
+        # 出力済みスキップ（入力が未更新で同じ設定の出力があれば再エンコードしない）
+        self.force_check = QCheckBox("強制再エンコード（出力済みファイルも処理し直す）")
+        self.force_check.setChecked(False)
+        settings_layout.addRow("", self.force_check)
+
         layout.addWidget(self.settings_group)
 
         # 出力設定
@@ -246,10 +452,14 @@ class NormalizeTab(QWidget):
 
         # 初期状態ではフォルダのみ表示（後でon_mode_changedで制御）
         output_layout.addRow("出力フォルダ:", self.output_dir_widget)
-        self.output_dir_form_row = output_layout.rowCount() - 1
+        self.output_dir_row = (
+            output_layout.labelForField(self.output_dir_widget),
+            self.output_dir_widget)
 
         output_layout.addRow("出力ファイル:", self.output_file_widget)
-        self.output_file_form_row = output_layout.rowCount() - 1
+        self.output_file_row = (
+            output_layout.labelForField(self.output_file_widget),
+            self.output_file_widget)
 
         layout.addWidget(self.output_group)
 
@@ -287,21 +497,26 @@ class NormalizeTab(QWidget):
         if file_path:
             self.reference_file_edit.setText(file_path)
 
+    def clear_reference_cache(self):
+        """参照ファイルの測定結果キャッシュを削除"""
+        from gui._ref_cache import clear_ref_cache
+        clear_ref_cache()
+        self.main_window.log_message("参照ファイルの測定キャッシュを削除しました")
+
     def on_preset_changed(self):
         """プリセット変更時の処理"""
-        is_reference = self.preset_combo.currentIndex() == 5  # 参照ファイルは6番目（インデックス5）
-
-        # 参照ファイル行の表示制御
-        settings_layout = self.settings_group.layout()
-        label_widget = settings_layout.itemAt(
-            self.reference_file_form_row, QFormLayout.LabelRole)
-        field_widget = settings_layout.itemAt(
-            self.reference_file_form_row, QFormLayout.FieldRole)
+        if self._loading:
+            return
+        is_reference = self.preset_combo.currentIndex() == REFERENCE_PRESET_INDEX
 
-        if label_widget and label_widget.widget():
-            label_widget.widget().setVisible(is_reference)
-        if field_widget and field_widget.widget():
-            field_widget.widget().setVisible(is_reference)
+        # 参照ファイル行の表示制御（再描画は最後に1回だけ）
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in self.reference_file_row:
+                widget.setVisible(is_reference)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def select_input_dir(self):
         """入力フォルダを選択"""
@@ -326,64 +541,56 @@ class NormalizeTab(QWidget):
 
     def on_mode_changed(self):
         """モード変更時の処理"""
+        if self._loading:
+            return
         is_normalize = self.mode_normalize_radio.isChecked()
         is_measure = self.mode_measure_radio.isChecked()
         # is_pipeline = self.mode_pipeline_radio.isChecked()
 
-        # 測定のみモードでは正規化設定を無効化
-        self.settings_group.setEnabled(not is_measure)
-
-        # パイプライン設定の表示制御
-        # self.pipeline_group.setVisible(is_pipeline)
-
-        # 出力設定の制御
-        # 測定のみ：出力設定を無効化（自動でCSV出力）
-        # 正規化：出力フォルダのみ表示・有効
-        # パイプライン：出力ファイルのみ表示・有効
-
-        # 測定のみモードでは出力設定全体を無効化
-        self.output_group.setEnabled(not is_measure)
-
-        # QFormLayoutの行全体（ラベル+ウィジェット）を制御
-        output_layout = self.output_group.layout()
-
-        # 出力フォルダ行の表示制御（測定・正規化モードで表示、パイプラインは無効化済み）
-        label_widget_dir = output_layout.itemAt(
-            self.output_dir_form_row, QFormLayout.LabelRole)
-        field_widget_dir = output_layout.itemAt(
-            self.output_dir_form_row, QFormLayout.FieldRole)
-
-        # 出力フォルダ行は常に表示（パイプライン機能は無効化済み）
-        if label_widget_dir and label_widget_dir.widget():
-            label_widget_dir.widget().setVisible(True)
-        if field_widget_dir and field_widget_dir.widget():
-            field_widget_dir.widget().setVisible(True)
-
-        # 出力ファイル行の表示制御（パイプライン無効化により常に非表示）
-        label_widget_file = output_layout.itemAt(
-            self.output_file_form_row, QFormLayout.LabelRole)
-        field_widget_file = output_layout.itemAt(
-            self.output_file_form_row, QFormLayout.FieldRole)
-
-        # 出力ファイル行は常に非表示（パイプライン機能は無効化済み）
-        if label_widget_file and label_widget_file.widget():
-            label_widget_file.widget().setVisible(False)
-        if field_widget_file and field_widget_file.widget():
-            field_widget_file.widget().setVisible(False)        # 実行ボタンのテキスト変更
-        if is_measure:
-            self.btn_execute.setText("測定実行")
-            # 測定のみモードでは出力設定のタイトルを変更
-            self.output_group.setTitle("出力設定（自動でCSVファイルを生成）")
-        elif is_normalize:
-            self.btn_execute.setText("正規化実行")
-            self.output_group.setTitle("出力設定")
-        # elif is_pipeline:
-        #    self.btn_execute.setText("パイプライン実行")
-        #    self.output_group.setTitle("出力設定")
-
-        # 設定保存・読込ボタンの表示制御（測定のみモードでは非表示）
-        self.btn_save_config.setVisible(not is_measure)
-        self.btn_load_config.setVisible(not is_measure)
+        # 表示切り替えをまとめて1回のレイアウト・再描画にする
+        self.setUpdatesEnabled(False)
+        try:
+            # 測定のみモードでは正規化設定を無効化
+            self.settings_group.setEnabled(not is_measure)
+
+            # パイプライン設定の表示制御
+            # self.pipeline_group.setVisible(is_pipeline)
+
+            # 出力設定の制御
+            # 測定のみ：出力設定を無効化（自動でCSV出力）
+            # 正規化：出力フォルダのみ表示・有効
+            # パイプライン：出力ファイルのみ表示・有効
+
+            # 測定のみモードでは出力設定全体を無効化
+            self.output_group.setEnabled(not is_measure)
+
+            # QFormLayoutの行全体（ラベル+ウィジェット）を制御
+            # 出力フォルダ行は常に表示（パイプライン機能は無効化済み）
+            for widget in self.output_dir_row:
+                widget.setVisible(True)
+
+            # 出力ファイル行は常に非表示（パイプライン機能は無効化済み）
+            for widget in self.output_file_row:
+                widget.setVisible(False)
+
+            # 実行ボタンのテキスト変更
+            if is_measure:
+                self.btn_execute.setText("測定実行")
+                # 測定のみモードでは出力設定のタイトルを変更
+                self.output_group.setTitle("出力設定（自動でCSVファイルを生成）")
+            elif is_normalize:
+                self.btn_execute.setText("正規化実行")
+                self.output_group.setTitle("出力設定")
+            # elif is_pipeline:
+            #    self.btn_execute.setText("パイプライン実行")
+            #    self.output_group.setTitle("出力設定")
+
+            # 設定保存・読込ボタンの表示制御（測定のみモードでは非表示）
+            self.btn_save_config.setVisible(not is_measure)
+            self.btn_load_config.setVisible(not is_measure)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def get_input_files(self) -> List[Path]:
         """入力フォルダから音声ファイルを取得"""
@@ -395,12 +602,9 @@ class NormalizeTab(QWidget):
         if not input_path.exists():
             return []
 
-        files = []
-        extensions = ['.wav', '.mp3', '.m4a', '.flac']
-        for ext in extensions:
-            files.extend(input_path.glob(f"**/*{ext}"))
-
-        return sorted(files)
+        # 拡張子ごとのglobではなく1回のディレクトリ走査で収集
+        from audioops.loudsync_legacy import find_audio_files
+        return find_audio_files(input_dir, sorted(AUDIO_EXTENSIONS))
 
     def run_execute(self):
         """実行処理"""
@@ -429,55 +633,92 @@ class NormalizeTab(QWidget):
         self.main_window.log_message(f"測定処理開始: {len(files)}ファイル")
 
         def measure_task():
+            log = BatchedLog(self.main_window)
             try:
-                from audioops.loudsync_legacy import measure_loudness, find_ffmpeg
+                from audioops.loudsync_legacy import (
+                    measure_loudness, measure_loudness_batch
+                )
+                from audioops.pipeline import BATCH_SIZE
+                from gui._measure_cache import load_measure_cache, save_measure_cache
                 import csv
 
-                ffmpeg_path = find_ffmpeg()
-                results = []
+                ffmpeg_path = self.main_window.get_ffmpeg_path()
+                # 前回この出力フォルダで測定した結果を読み込み、未変更のファイルは再測定しない
+                load_measure_cache(output_dir)
 
-                for i, file_path in enumerate(files, 1):
-                    self.main_window.log_message(
-                        f"[{i}/{len(files)}] 測定中: {file_path.name}")
+                n_files = len(files)
 
-                    result = measure_loudness(str(file_path), ffmpeg_path)
-                    results.append(result)
+                def row_for(i: int, result: Dict) -> tuple:
+                    name = files[i].name
+                    lufs = result['integrated_lufs']
+                    lra = result['loudness_range']
+                    tp = result['true_peak_dbtp']
 
                     if result['status'] == 'OK':
-                        self.main_window.log_message(
-                            f"  LUFS: {result['integrated_lufs']:.1f} | "
-                            f"TP: {result['true_peak_dbtp']:.1f} | "
-                            f"LRA: {result['loudness_range']:.1f}"
-                        )
+                        log("[%d/%d] %s | LUFS: %.1f | TP: %.1f | LRA: %.1f" % (
+                            i + 1, n_files, name, lufs,
+                            tp if tp is not None else float('nan'),
+                            lra if lra is not None else float('nan')))
                     else:
-                        self.main_window.log_message(
-                            f"  測定失敗: {result['status']}")
+                        log("[%d/%d] %s | 測定失敗: %s" % (
+                            i + 1, n_files, name, result['status']))
+                    # CSVの1行
+                    return (name, lufs, lra, tp, result['status'])
+
+                # チャンクごとの測定をQThreadPoolで並列実行（結果は入力順）
+                chunks = [list(range(start, min(start + BATCH_SIZE, n_files)))
+                          for start in range(0, n_files, BATCH_SIZE)]
+                threads = pool_ffmpeg_threads(len(chunks))
+
+                def measure_chunk(_, idxs: List[int]) -> List[tuple]:
+                    # BATCH_SIZE件を1つのffmpegで測定し、失敗したファイルだけ単独で再測定
+                    paths = [os.fspath(files[i]) for i in idxs]
+                    if len(paths) > 1:
+                        results = measure_loudness_batch(paths, ffmpeg_path,
+                                                         threads=threads)
+                    else:
+                        results = [measure_loudness(paths[0], ffmpeg_path,
+                                                    threads=threads)]
+                    return [row_for(i, result if result['status'] == 'OK'
+                                    else measure_loudness(result['file'], ffmpeg_path,
+                                                          threads=threads))
+                            for i, result in zip(idxs, results)]
+
+                futures = [submit_to_pool(measure_chunk, n, idxs)
+                           for n, idxs in enumerate(chunks)]
 
-                # CSV保存
+                # CSVは先に開き、チャンクの結果を入力順に届き次第書き込む（全件をメモリに溜めない）
                 csv_path = Path(output_dir) / "loudness_measurement.csv"
                 with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['file', 'integrated_lufs',
-                                  'loudness_range', 'true_peak_dbtp', 'status']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for result in results:
-                        writer.writerow({
-                            'file': Path(result['file']).name,
-                            'integrated_lufs': result['integrated_lufs'],
-                            'loudness_range': result['loudness_range'],
-                            'true_peak_dbtp': result['true_peak_dbtp'],
-                            'status': result['status']
-                        })
-
-                self.main_window.log_message(f"測定結果をCSVに保存: {csv_path}")
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['file', 'integrated_lufs',
+                                     'loudness_range', 'true_peak_dbtp', 'status'])
+                    for idxs, future in zip(chunks, futures):
+                        wait_futures([future])
+                        error = future.exception()
+                        if error is None:
+                            rows = future.result()
+                        else:
+                            rows = [(files[i].name, None, None, None, f'ERROR: {error}')
+                                    for i in idxs]
+                            log("\n".join(f"  測定エラー: {row[0]}: {error}" for row in rows))
+                        # チャンク単位で1回のwriterowsにまとめて書き込む
+                        writer.writerows(rows)
+                        csvfile.flush()
+
+                log(f"測定結果をCSVに保存: {csv_path}")
+                try:
+                    save_measure_cache(output_dir, files)
+                except OSError as e:
+                    log(f"測定キャッシュの保存に失敗しました: {str(e)}")
                 return True
             except Exception as e:
-                self.main_window.log_message(f"エラー: {str(e)}")
+                log(f"エラー: {str(e)}")
                 return False
+            finally:
+                log.flush()
 
-        self.worker = ProcessWorker(measure_task)
-        self.worker.finished.connect(self.main_window.on_process_finished)
-        self.worker.start()
+        self.worker = self.main_window.start_worker(measure_task)
 
     def save_config(self):
         """現在の設定をJSONファイルに保存"""
@@ -507,8 +748,8 @@ class NormalizeTab(QWidget):
             )
 
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, ensure_ascii=False, indent=2)
+                from gui._atomic import dump_json_atomic
+                dump_json_atomic(file_path, config)
 
                 QMessageBox.information(
                     self, "設定保存", f"設定が保存されました:\n{file_path}")
@@ -532,44 +773,40 @@ class NormalizeTab(QWidget):
             if not file_path:
                 return
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
-            # 設定を復元
-            if "input_directory" in config and config["input_directory"] != "入力フォルダが選択されていません":
-                self.input_dir_edit.setText(config["input_directory"])
-
-            if "output_directory" in config and config["output_directory"] != "出力フォルダが選択されていません":
-                self.output_dir_edit.setText(config["output_directory"])
-
-            if "mode" in config:
-                mode = config["mode"]
-                if mode.get("measure_only", False):
-                    self.mode_measure_radio.setChecked(True)
-                elif mode.get("normalize", False):
-                    self.mode_normalize_radio.setChecked(True)
-                # elif mode.get("pipeline", False) and hasattr(self, 'mode_pipeline_radio'):
-                #     self.mode_pipeline_radio.setChecked(True)
-
-            if "preset_index" in config:
-                preset_idx = config["preset_index"]
-                if 0 <= preset_idx < self.preset_combo.count():
-                    self.preset_combo.setCurrentIndex(preset_idx)
-
-            if "reference_file" in config and hasattr(self, 'reference_file_edit'):
-                ref_file = config["reference_file"]
-                if ref_file and ref_file != "参照ファイルが選択されていません":
-                    self.reference_file_edit.setText(ref_file)
-
-            if "output_format" in config:
-                format_text = config["output_format"]
-                format_idx = self.format_combo.findText(format_text)
-                if format_idx >= 0:
-                    self.format_combo.setCurrentIndex(format_idx)
-
-            # モード変更とプリセット変更を反映
-            self.on_mode_changed()
-            self.on_preset_changed()
+            config = _read_config(file_path, os.stat(file_path).st_mtime_ns)
+
+            # 設定を復元（モード変更とプリセット変更は最後に1回だけ反映）
+            with self.restoring():
+                if "input_directory" in config and config["input_directory"] != "入力フォルダが選択されていません":
+                    self.input_dir_edit.setText(config["input_directory"])
+
+                if "output_directory" in config and config["output_directory"] != "出力フォルダが選択されていません":
+                    self.output_dir_edit.setText(config["output_directory"])
+
+                if "mode" in config:
+                    mode = config["mode"]
+                    if mode.get("measure_only", False):
+                        self.mode_measure_radio.setChecked(True)
+                    elif mode.get("normalize", False):
+                        self.mode_normalize_radio.setChecked(True)
+                    # elif mode.get("pipeline", False) and hasattr(self, 'mode_pipeline_radio'):
+                    #     self.mode_pipeline_radio.setChecked(True)
+
+                if "preset_index" in config:
+                    preset_idx = config["preset_index"]
+                    if 0 <= preset_idx < self.preset_combo.count():
+                        self.preset_combo.setCurrentIndex(preset_idx)
+
+                if "reference_file" in config and hasattr(self, 'reference_file_edit'):
+                    ref_file = config["reference_file"]
+                    if ref_file and ref_file != "参照ファイルが選択されていません":
+                        self.reference_file_edit.setText(ref_file)
+
+                if "output_format" in config:
+                    format_text = config["output_format"]
+                    format_idx = self.format_combo.findText(format_text)
+                    if format_idx >= 0:
+                        self.format_combo.setCurrentIndex(format_idx)
 
             QMessageBox.information(self, "設定読込", f"設定が読み込まれました:\n{file_path}")
             self.main_window.log_message(f"設定を読み込みました: {file_path}")
@@ -590,44 +827,32 @@ class NormalizeTab(QWidget):
 
         # プリセット設定を取得
         preset_index = self.preset_combo.currentIndex()
+        target_lufs = None
+        reference_future = None
 
-        if preset_index == 5:  # 参照ファイル
+        if preset_index == REFERENCE_PRESET_INDEX:
             reference_file = self.reference_file_edit.text()
             if reference_file == "参照ファイルが選択されていません":
                 QMessageBox.warning(self, "警告", "参照ファイルを選択してください")
                 return
 
-            # 参照ファイルのラウドネスを測定
+            # 参照ファイルのラウドネスを測定（GUIスレッドを止めないようスレッドプールで先行実行）
             self.main_window.log_message(
                 f"参照ファイルのラウドネスを測定中: {Path(reference_file).name}")
 
             try:
-                from audioops.loudsync_legacy import measure_loudness, find_ffmpeg
-                ffmpeg_path = find_ffmpeg()
-                ref_result = measure_loudness(reference_file, ffmpeg_path)
-
-                if ref_result['status'] != 'OK':
-                    QMessageBox.critical(
-                        self, "エラー", f"参照ファイルの測定に失敗しました: {ref_result['status']}")
-                    return
-
-                target_lufs = ref_result['integrated_lufs']
-                self.main_window.log_message(
-                    f"参照ファイルのラウドネス: {target_lufs:.1f} LUFS")
-
+                from gui._ref_cache import get_cached_lufs
+                ffmpeg_path = self.main_window.get_ffmpeg_path()
             except Exception as e:
                 QMessageBox.critical(self, "エラー", f"参照ファイルの測定エラー: {str(e)}")
                 return
+            # 同じ参照ファイル（パス・サイズ・更新時刻が一致）なら前回の測定値を再利用
+            reference_future = submit_to_pool(
+                get_cached_lufs, reference_file, ffmpeg_path)
         else:
             # 固定プリセット
-            preset_map = {
-                0: -16.0,  # ポッドキャスト
-                1: -18.0,  # BGM -18
-                2: -19.0,  # BGM -19
-                3: -20.0,  # BGM -20
-                4: -23.0   # 放送
-            }
-            target_lufs = preset_map.get(preset_index, -16.0)
+            target_lufs = (NORMALIZE_PRESETS[preset_index][1]
+                           if 0 <= preset_index < len(NORMALIZE_PRESETS) else -16.0)
 
         # 出力形式設定
         format_map = {"WAV": "wav", "MP3": "mp3", "M4A": "m4a"}
@@ -638,60 +863,175 @@ class NormalizeTab(QWidget):
 
         # 2パス処理
         two_pass = self.two_pass_check.isChecked()
+        batch_mode = self.batch_check.isChecked()
+        force = self.force_check.isChecked()
 
         self.main_window.log_message(f"正規化処理開始: {len(files)}ファイル")
-        self.main_window.log_message(
-            f"ターゲット: {target_lufs} LUFS, 形式: {output_format.upper()}, {sample_rate}Hz")
 
         def normalize_task():
+            nonlocal target_lufs
+            log = BatchedLog(self.main_window)
             try:
-                from audioops.loudsync_legacy import normalize_audio, find_ffmpeg
-
-                ffmpeg_path = find_ffmpeg()
+                from audioops.loudsync_legacy import normalize_audio, LoudSyncError
+                from audioops.pipeline import BATCH_MIN_FILES
+
+                if reference_future is not None:
+                    # 参照ファイルの測定結果が必要になった時点で待つ
+                    wait_futures([reference_future])
+                    try:
+                        target_lufs = reference_future.result()
+                    except LoudSyncError as e:
+                        log(
+                            f"参照ファイルの測定に失敗しました: {str(e)}")
+                        return False
+                    log(
+                        f"参照ファイルのラウドネス: {target_lufs:.1f} LUFS")
+
+                log(
+                    f"ターゲット: {target_lufs} LUFS, 形式: {output_format.upper()}, {sample_rate}Hz")
+
+                ffmpeg_path = self.main_window.get_ffmpeg_path()
                 output_path = Path(output_dir)
                 output_path.mkdir(parents=True, exist_ok=True)
 
-                success_count = 0
-
-                for i, file_path in enumerate(files, 1):
-                    self.main_window.log_message(
-                        f"[{i}/{len(files)}] 正規化中: {file_path.name}")
-
+                # 前回と同じ設定で出力済み（入力も未更新）のファイルはスキップ
+                params = {"target_lufs": target_lufs, "two_pass": two_pass,
+                          "sample_rate": sample_rate}
+                pending = files
+                if not force:
+                    pending = []
+                    existing = existing_names(output_path)
+                    for file_path in files:
+                        output_file = output_path / \
+                            f"{file_path.stem}_normalized.{output_format}"
+                        if is_output_up_to_date(file_path, output_file, params,
+                                                existing):
+                            log(f"スキップ（出力済み）: {output_file.name}")
+                        else:
+                            pending.append(file_path)
+                skipped = len(files) - len(pending)
+
+                n_files = len(pending)
+                threads = pool_ffmpeg_threads(n_files)
+
+                def normalize_one(i: int, file_path: Path) -> bool:
                     # 出力ファイル名を決定
                     output_file = output_path / \
                         f"{file_path.stem}_normalized.{output_format}"
 
                     # 正規化実行
                     success = normalize_audio(
-                        str(file_path),
-                        str(output_file),
+                        os.fspath(file_path),
+                        os.fspath(output_file),
                         target_i=target_lufs,
-                        target_tp=-2.0,  # True Peak を -2dB に設定
+                        target_tp=NORMALIZE_TARGET_TP,
                         sample_rate=sample_rate,
                         output_format=output_format,
                         two_pass=two_pass,
-                        ffmpeg_path=ffmpeg_path
+                        ffmpeg_path=ffmpeg_path,
+                        threads=threads
                     )
 
                     if success:
-                        self.main_window.log_message(
-                            f"  ✓ 完了: {output_file.name}")
-                        success_count += 1
+                        write_output_sidecar(output_file, params)
+                        log(
+                            f"[{i + 1}/{n_files}] ✓ 完了: {output_file.name}")
                     else:
-                        self.main_window.log_message(
-                            f"  ✗ 失敗: {file_path.name}")
-
-                self.main_window.log_message(
+                        log(
+                            f"[{i + 1}/{n_files}] ✗ 失敗: {file_path.name}")
+                    return success
+
+                if batch_mode and n_files > BATCH_MIN_FILES:
+                    success_count = self.normalize_batched(
+                        pending, output_path, output_format, target_lufs,
+                        sample_rate, two_pass, ffmpeg_path, log, params)
+                else:
+                    # ファイルごとの正規化をQThreadPoolで並列実行
+                    success_count = sum(
+                        1 for result in run_files_in_pool(normalize_one, pending)
+                        if result is True)
+                success_count += skipped
+
+                log(
                     f"正規化完了: {success_count}/{len(files)} ファイル成功")
                 return success_count > 0
 
             except Exception as e:
-                self.main_window.log_message(f"エラー: {str(e)}")
+                log(f"エラー: {str(e)}")
                 return False
-
-        self.worker = ProcessWorker(normalize_task)
-        self.worker.finished.connect(self.main_window.on_process_finished)
-        self.worker.start()
+            finally:
+                log.flush()
+
+        # 処理中表示（完了時にon_process_finishedで非表示）
+        self.main_window.progress_bar.setRange(0, 0)
+        self.main_window.progress_bar.setVisible(True)
+
+        self.worker = self.main_window.start_worker(normalize_task)
+
+    def normalize_batched(self, files: List[Path], output_path: Path,
+                          output_format: str, target_lufs: float, sample_rate: int,
+                          two_pass: bool, ffmpeg_path: str, log,
+                          params: Optional[Dict] = None) -> int:
+        """BATCH_SIZE件ずつ1つのffmpegプロセスで正規化し、成功数を返す（ワーカースレッドで実行）
+        paramsを渡すと、成功した出力ごとにその設定をサイドカーJSONへ記録する"""
+        from audioops.loudsync_legacy import (
+            measure_loudness, loudnorm_filter, normalize_batch, normalize_audio
+        )
+        from audioops.pipeline import BATCH_SIZE
+        target_tp = NORMALIZE_TARGET_TP
+        output_files = [output_path / f"{p.stem}_normalized.{output_format}"
+                        for p in files]
+
+        # 測定パス（2パス時のみ、ファイルごとに並列）
+        measure_threads = pool_ffmpeg_threads(len(files))
+
+        def measure_one(i: int, file_path: Path) -> Optional[Dict]:
+            if not two_pass:
+                return None
+            result = measure_loudness(str(file_path), ffmpeg_path,
+                                      target_lufs, target_tp, measure_threads)
+            return result if result['status'] == 'OK' and result['raw_json'] else None
+
+        measurements = [m if isinstance(m, dict) else None
+                        for m in run_files_in_pool(measure_one, files)]
+
+        def normalize_chunk(_, idxs: List[int]) -> List[int]:
+            success = normalize_batch(
+                [str(files[i]) for i in idxs],
+                [str(output_files[i]) for i in idxs],
+                [loudnorm_filter(target_lufs, target_tp,
+                                 measurements[i]['raw_json'] if measurements[i] else None)
+                 for i in idxs],
+                sample_rate, [output_format] * len(idxs), ffmpeg_path,
+                threads=threads)
+            if success:
+                return idxs
+
+            # バッチ失敗時（コマンドライン長超過を含む）はファイル単位にフォールバック
+            return [i for i in idxs if normalize_audio(
+                str(files[i]), str(output_files[i]),
+                target_i=target_lufs, target_tp=target_tp,
+                sample_rate=sample_rate, output_format=output_format,
+                two_pass=measurements[i] is not None, ffmpeg_path=ffmpeg_path,
+                threads=threads,
+                measured=measurements[i])]
+
+        chunks = [list(range(start, min(start + BATCH_SIZE, len(files))))
+                  for start in range(0, len(files), BATCH_SIZE)]
+        threads = pool_ffmpeg_threads(len(chunks))
+        succeeded = set()
+        for idxs in run_files_in_pool(normalize_chunk, chunks):
+            if isinstance(idxs, list):
+                succeeded.update(idxs)
+
+        for i, file_path in enumerate(files):
+            if i in succeeded:
+                if params is not None:
+                    write_output_sidecar(output_files[i], params)
+                log(f"[{i + 1}/{len(files)}] ✓ 完了: {output_files[i].name}")
+            else:
+                log(f"[{i + 1}/{len(files)}] ✗ 失敗: {file_path.name}")
+        return len(succeeded)
 
     def run_pipeline(self, files: List[Path]):
         """パイプライン実行"""
@@ -701,15 +1041,9 @@ class NormalizeTab(QWidget):
             return
 
         # プリセット設定を作成
-        preset_map = {
-            0: "podcast",
-            1: "bgm",
-            2: "bgm",
-            3: "bgm",
-            4: "broadcast"
-        }
-        preset_name = preset_map.get(
-            self.preset_combo.currentIndex(), "podcast")
+        preset_index = self.preset_combo.currentIndex()
+        preset_name = (NORMALIZE_PRESETS[preset_index][2]
+                       if 0 <= preset_index < len(NORMALIZE_PRESETS) else "podcast")
 
         from audioops.pipeline import create_preset_config
         config = create_preset_config(preset_name)
@@ -724,9 +1058,7 @@ class NormalizeTab(QWidget):
             from audioops.pipeline import run_pipeline
             return run_pipeline(files, Path(output_file), config)
 
-        self.worker = ProcessWorker(pipeline_task)
-        self.worker.finished.connect(self.main_window.on_process_finished)
-        self.worker.start()
+        self.worker = self.main_window.start_worker(pipeline_task)
 
     def select_output_dir(self):
         """出力フォルダを選択"""
@@ -798,6 +1130,10 @@ class FadeTab(QWidget):
         self.codec_combo.addItems(["aac", "libmp3lame", "pcm_s16le"])
         fade_layout.addRow("コーデック:", self.codec_combo)
 
+        # 出力済みスキップ（入力が未更新で同じ設定の出力があれば処理しない）
+        self.force_check = QCheckBox("強制再処理（出力済みファイルも処理し直す）")
+        fade_layout.addRow("", self.force_check)
+
         layout.addWidget(fade_group)
 
         # 出力設定
@@ -827,8 +1163,7 @@ class FadeTab(QWidget):
             self, "音声ファイルを選択", "",
             "Audio Files (*.wav *.mp3 *.m4a *.flac);;All Files (*)"
         )
-        for file_path in files:
-            self.file_list.addItem(file_path)
+        self.file_list.add_paths(files)
 
     def select_output_dir(self):
         dir_path = QFileDialog.getExistingDirectory(self, "出力フォルダを選択")
@@ -836,10 +1171,7 @@ class FadeTab(QWidget):
             self.output_dir_edit.setText(dir_path)
 
     def get_files(self) -> List[Path]:
-        files = []
-        for i in range(self.file_list.count()):
-            files.append(Path(self.file_list.item(i).text()))
-        return files
+        return self.file_list.files()
 
     def run_fade(self):
         files = self.get_files()
@@ -860,39 +1192,118 @@ class FadeTab(QWidget):
 
         self.main_window.log_message(f"フェード処理開始: {len(files)}ファイル")
 
+        # フェード設定はワーカーからウィジェットに触れないよう、開始前にGUIスレッドで読む
+        # フェードアウト時間は「末尾から」の設定値と同じ秒数に自動設定
+        fade_in_ms = self.fade_in_spin.value()
+        fade_out_from_end_sec = self.from_end_spin.value()
+        fade_out_ms = int(fade_out_from_end_sec * 1000)  # 秒をミリ秒に変換
+        force = self.force_check.isChecked()
+
         def fade_task():
+            log = BatchedLog(self.main_window)
             try:
-                for i, file_path in enumerate(files, 1):
-                    self.main_window.log_message(
-                        f"[{i}/{len(files)}] Processing: {file_path.name}")
-
-                    # 出力ファイル名
-                    output_file = output_path / \
-                        f"{file_path.stem}_fade{file_path.suffix}"
+                from audioops.core import fade_file, fade_batch, duration_sec
+                from audioops.pipeline import BATCH_SIZE
+
+                n_files = len(files)
+                params = {"fade_in_ms": fade_in_ms, "fade_out_ms": fade_out_ms,
+                          "fade_out_from_end_sec": fade_out_from_end_sec}
+
+                def output_for(file_path: Path) -> Path:
+                    return output_path / f"{file_path.stem}_fade{file_path.suffix}"
+
+                # 前回と同じ設定で出力済み（入力も未更新）のファイルはスキップ
+                existing = None if force else existing_names(output_path)
+                pending = files if force else [
+                    p for p in files
+                    if not is_output_up_to_date(p, output_for(p), params,
+                                                existing)]
+                skipped = n_files - len(pending)
+                if skipped:
+                    log(f"出力済みのため{skipped}ファイルをスキップ")
+
+                # 長さは最初に全ファイル分を並列に1回だけ取得し、フェード処理へ渡す
+                # （各フェード処理での再プローブを省き、読めないファイルは先に除外）
+                durations: Dict[Path, float] = {}
+                probed = run_files_in_pool(lambda _, p: duration_sec(p), pending)
+                for file_path, duration in zip(pending, probed):
+                    if isinstance(duration, Exception):
+                        log(f"  ✗ Failed: {file_path.name}: {duration}")
+                    else:
+                        durations[file_path] = duration
+                targets = [p for p in pending if p in durations]
+
+                # WAVはffmpegを起動せずに処理できるので1件ずつ、
+                # それ以外は同じ拡張子ごとにBATCH_SIZE件をffmpeg 1回でまとめて処理
+                chunks = [[file_path] for file_path in targets
+                          if file_path.suffix.lower() == ".wav"]
+                by_suffix: Dict[str, List[Path]] = {}
+                for file_path in targets:
+                    suffix = file_path.suffix.lower()
+                    if suffix != ".wav":
+                        by_suffix.setdefault(suffix, []).append(file_path)
+                for group in by_suffix.values():
+                    chunks.extend(group[start:start + BATCH_SIZE]
+                                  for start in range(0, len(group), BATCH_SIZE))
+
+                # 同時に動くffmpeg同士でCPUを取り合わないよう、1プロセスあたりのスレッド数を制限
+                threads_per_job = pool_ffmpeg_threads(len(chunks))
+                ffmpeg_path = self.main_window.get_ffmpeg_path()
+
+                def fade_chunk(_, chunk: List[Path]) -> list:
+                    output_files = [output_for(p) for p in chunk]
+                    fade_args = dict(fade_in_ms=fade_in_ms,
+                                     fade_out_ms=fade_out_ms,
+                                     fade_out_from_end_sec=fade_out_from_end_sec,
+                                     ffmpeg_path=ffmpeg_path,
+                                     threads=threads_per_job)
 
                     # フェード処理（コーデックは拡張子から自動選択）
-                    # フェードアウト時間は「末尾から」の設定値と同じ秒数に自動設定
-                    fade_out_duration_sec = self.from_end_spin.value()
-                    fade_out_ms = int(fade_out_duration_sec * 1000)  # 秒をミリ秒に変換
-
-                    fade_file(
-                        file_path, output_file,
-                        fade_in_ms=self.fade_in_spin.value(),
-                        fade_out_ms=fade_out_ms,
-                        fade_out_from_end_sec=self.from_end_spin.value()
-                    )
-
-                    self.main_window.log_message(
-                        f"  ✓ Completed: {output_file.name}")
-
-                return True
+                    if len(chunk) > 1:
+                        try:
+                            fade_batch(chunk, output_files,
+                                       durations=[durations[p] for p in chunk],
+                                       **fade_args)
+                            return [(o, None) for o in output_files]
+                        except Exception as e:
+                            # バッチ失敗時はファイル単位にフォールバック
+                            log(f"  バッチ処理に失敗したため1件ずつ処理します: {e}")
+
+                    results = []
+                    for file_path, output_file in zip(chunk, output_files):
+                        try:
+                            fade_file(file_path, output_file,
+                                      duration_sec_hint=durations[file_path],
+                                      **fade_args)
+                            results.append((output_file, None))
+                        except Exception as e:
+                            results.append((output_file, e))
+                    return results
+
+                # チャンクごとのフェードをQThreadPoolで並列実行
+                success_count = skipped
+                done = n_files - len(targets)
+                for chunk, results in zip(chunks, run_files_in_pool(fade_chunk, chunks)):
+                    if isinstance(results, Exception):
+                        results = [(None, results)] * len(chunk)
+                    for file_path, (output_file, error) in zip(chunk, results):
+                        done += 1
+                        if error is None:
+                            success_count += 1
+                            write_output_sidecar(output_file, params)
+                            log(f"[{done}/{n_files}] ✓ Completed: {output_file.name}")
+                        else:
+                            log(f"[{done}/{n_files}] ✗ Failed: {file_path.name}: {error}")
+
+                log(f"フェード完了: {success_count}/{n_files} ファイル成功")
+                return success_count > 0
             except Exception as e:
-                self.main_window.log_message(f"エラー: {str(e)}")
+                log(f"エラー: {str(e)}")
                 return False
+            finally:
+                log.flush()
 
-        self.worker = ProcessWorker(fade_task)
-        self.worker.finished.connect(self.main_window.on_process_finished)
-        self.worker.start()
+        self.worker = self.main_window.start_worker(fade_task)
 
 
 class CrossfadeTab(QWidget):
@@ -949,7 +1360,8 @@ class CrossfadeTab(QWidget):
         crossfade_layout.addRow("カーブ:", self.curve_combo)
 
         self.codec_combo = QComboBox()
-        self.codec_combo.addItems(["libmp3lame", "aac", "pcm_s16le"])
+        # libshineは固定小数点の高速MP3エンコーダ（--enable-libshine のffmpegが必要）
+        self.codec_combo.addItems(["libmp3lame", "libshine", "aac", "pcm_s16le"])
         crossfade_layout.addRow("コーデック:", self.codec_combo)
 
         layout.addWidget(crossfade_group)
@@ -981,8 +1393,7 @@ class CrossfadeTab(QWidget):
             self, "音声ファイルを選択", "",
             "Audio Files (*.wav *.mp3 *.m4a *.flac);;All Files (*)"
         )
-        for file_path in files:
-            self.file_list.addItem(file_path)
+        self.file_list.add_paths(files)
 
     def move_up(self):
         current_row = self.file_list.currentRow()
@@ -1007,10 +1418,7 @@ class CrossfadeTab(QWidget):
             self.output_file_edit.setText(file_path)
 
     def get_files(self) -> List[Path]:
-        files = []
-        for i in range(self.file_list.count()):
-            files.append(Path(self.file_list.item(i).text()))
-        return files
+        return self.file_list.files()
 
     def run_crossfade(self):
         files = self.get_files()
@@ -1025,28 +1433,46 @@ class CrossfadeTab(QWidget):
 
         self.main_window.log_message(f"クロスフェード処理開始: {len(files)}ファイル")
 
+        # 設定はワーカーからウィジェットに触れないよう、開始前にGUIスレッドで読む
+        overlap_sec = self.overlap_spin.value()
+        curve = self.curve_combo.currentText()
+        codec = self.codec_combo.currentText()
+
         def crossfade_task():
             try:
+                from audioops.core import crossfade_sequence
+
                 crossfade_sequence(
                     files, Path(output_file),
-                    overlap_sec=self.overlap_spin.value(),
-                    curve1=self.curve_combo.currentText(),
-                    curve2=self.curve_combo.currentText(),
-                    codec=self.codec_combo.currentText()
+                    overlap_sec=overlap_sec,
+                    curve1=curve,
+                    curve2=curve,
+                    codec=codec,
+                    ffmpeg_path=self.main_window.get_ffmpeg_path()
                 )
                 return True
             except Exception as e:
                 self.main_window.log_message(f"エラー: {str(e)}")
                 return False
 
-        self.worker = ProcessWorker(crossfade_task)
-        self.worker.finished.connect(self.main_window.on_process_finished)
-        self.worker.start()
+        self.worker = self.main_window.start_worker(crossfade_task)
 
 
 class LoudSyncSuiteMainWindow(QMainWindow):
     """LoudSync Suite メインウィンドウ"""
 
+    # ワーカースレッドからのログ行（GUIスレッドへキュー接続で渡す）
+    log_line = Signal(str)
+
+    # この間隔でまとめてログエリアへ追記（1行ごとの再描画を避ける）
+    LOG_FLUSH_MS = 50
+    # ログファイルへはこの行数ごとにまとめて書き込む
+    LOG_FILE_BATCH = 100
+    # ログエリアに残す最大行数（古い行から捨てる。全文はログファイルに残る）
+    LOG_MAX_BLOCKS = 2000
+    # この時間内の設定保存要求はまとめて1回にする
+    SETTINGS_SAVE_DEBOUNCE_MS = 500
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LoudSync Suite - フェード/クロスフェード統合")
@@ -1058,10 +1484,30 @@ class LoudSyncSuiteMainWindow(QMainWindow):
         # ログ設定の初期化
         self.log_file_path = None
         self.setup_logging()
+        self._log_buffer = deque()
+        self._log_flush_pending = False
+        self.log_line.connect(self._enqueue_log)
+
+        # ffmpegのパス（初回使用時に1回だけ検出）
+        self._ffmpeg_path = None
+
+        # 最後に保存（読込）した設定。変化がなければ書き込まない
+        self._saved_settings = None
+        self._settings_lock = threading.Lock()
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(self.SETTINGS_SAVE_DEBOUNCE_MS)
+        self._settings_timer.timeout.connect(
+            lambda: self.save_settings(background=True))
 
         self.setup_ui()
         self.load_settings()
 
+        # ffmpegの検出（PATH検索・stat）は起動直後にスレッドプールで済ませておき、
+        # 最初の実行時に入力フォルダの走査などと直列にならないようにする
+        # （見つからない場合の例外は実行時のget_ffmpeg_pathで改めて報告される）
+        submit_to_pool(self.get_ffmpeg_path)
+
     def setup_logging(self):
         """ログ設定を初期化"""
         # デフォルトの出力ディレクトリは normalized フォルダ
@@ -1070,43 +1516,64 @@ class LoudSyncSuiteMainWindow(QMainWindow):
 
         self.log_file_path = default_output_dir / "LoudSync.log"
 
-        # ログファイルのハンドラを設定
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-
-        # ファイルハンドラを追加
+        # 書式は1つのFormatterをファイル・コンソールで共有（ファイル切り替え時も再利用）
+        self.log_formatter = logging.Formatter(
+            '%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        logging.getLogger().setLevel(logging.INFO)
+
+        # コンソール出力は端末から起動した場合のみ（ウィンドウ版ではstderrが無いか捨てられる）
+        handlers = []
+        if sys.stderr is not None and sys.stderr.isatty():
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(self.log_formatter)
+            handlers.append(console_handler)
+
+        # ルートロガーにはキューへ積むだけのハンドラを付け、ファイルへの書き込みは
+        # QueueListenerの専用スレッドで行う（ワーカースレッドをディスクI/Oで止めない）
+        # INFO行はLOG_FILE_BATCH行ごとにまとめて書き込む（ERROR以上と処理完了時は即時）
+        log_queue = queue.SimpleQueue()
+        self.queue_handler = logging.handlers.QueueHandler(log_queue)
+        self.queue_handler.setLevel(logging.INFO)
+        self.log_handler = logging.handlers.MemoryHandler(
+            self.LOG_FILE_BATCH, flushLevel=logging.ERROR)
+        self.log_listener = logging.handlers.QueueListener(
+            log_queue, self.log_handler, *handlers)
+
+        self.open_log_file()
+        self.log_listener.start()
+        logging.getLogger().addHandler(self.queue_handler)
+
+    def open_log_file(self):
+        """log_file_path へのファイルハンドラを書き込み先に設定"""
         self.file_handler = logging.FileHandler(
             self.log_file_path, encoding='utf-8')
         self.file_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        self.file_handler.setFormatter(formatter)
+        self.file_handler.setFormatter(self.log_formatter)
+        self.log_handler.setTarget(self.file_handler)
 
-        # ルートロガーにハンドラを追加
-        logging.getLogger().addHandler(self.file_handler)
+    def close_log_file(self):
+        """溜まっているログを書き出してファイルハンドラを閉じる（リスナー停止中に呼ぶ）"""
+        self.log_handler.flush()
+        self.log_handler.setTarget(None)
+        self.file_handler.close()
+
+    def flush_log_file(self):
+        """キューに残っているログも含めて全てファイルへ書き出す"""
+        self.log_listener.stop()  # キューを処理し終えるまで待つ
+        self.log_handler.flush()
+        self.log_listener.start()
 
     def update_log_file_path(self, output_dir: str):
         """ログファイルのパスを更新"""
         if output_dir and output_dir != "出力フォルダが選択されていません":
             new_log_path = Path(output_dir) / "LoudSync.log"
             if new_log_path != self.log_file_path:
-                # 古いハンドラを削除
-                if hasattr(self, 'file_handler'):
-                    logging.getLogger().removeHandler(self.file_handler)
-                    self.file_handler.close()
-
-                # 新しいハンドラを設定
+                # 書き込み先だけを差し替え（キュー側のハンドラはそのまま）
+                self.log_listener.stop()
+                self.close_log_file()
                 self.log_file_path = new_log_path
-                self.file_handler = logging.FileHandler(
-                    self.log_file_path, encoding='utf-8')
-                self.file_handler.setLevel(logging.INFO)
-                formatter = logging.Formatter(
-                    '%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-                self.file_handler.setFormatter(formatter)
-                logging.getLogger().addHandler(self.file_handler)
+                self.open_log_file()
+                self.log_listener.start()
 
     def setup_ui(self):
         # 中央ウィジェット
@@ -1141,9 +1608,11 @@ class LoudSyncSuiteMainWindow(QMainWindow):
         log_group = QGroupBox("ログ")
         log_layout = QVBoxLayout(log_group)
 
-        self.log_text = QTextEdit()
+        # ログはプレーンテキストのみなので、リッチテキスト判定・レイアウトのないQPlainTextEditを使う
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(200)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_BLOCKS)
         log_layout.addWidget(self.log_text)
 
         splitter.addWidget(log_group)
@@ -1162,28 +1631,65 @@ class LoudSyncSuiteMainWindow(QMainWindow):
         # 初期ログ
         self.log_message("LoudSync Suite を開始しました")
 
+    def get_ffmpeg_path(self) -> str:
+        """ffmpegのパスを返す（検出は初回のみ。見つからない場合は例外）"""
+        if self._ffmpeg_path is None:
+            from audioops.loudsync_legacy import find_ffmpeg
+            self._ffmpeg_path = find_ffmpeg()
+        return self._ffmpeg_path
+
     def log_message(self, message: str):
-        """ログメッセージを追加（GUI表示とファイル出力）"""
-        from datetime import datetime
+        """ログメッセージを追加（GUI表示とファイル出力）
+        ワーカースレッドからも呼べる（GUIへの反映はシグナル経由でGUIスレッドが行う）"""
+        self.log_messages([message])
+
+    def log_messages(self, messages: List[str]):
+        """複数行のログをまとめて追加（GUIへは1回のシグナルで送る）"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        gui_message = f"[{timestamp}] {message}"
 
         # GUIのログエリアに表示
-        self.log_text.append(gui_message)
+        self.log_line.emit("\n".join(f"[{timestamp}] {m}" for m in messages))
 
         # ファイルにも出力
-        logging.info(message)
+        for message in messages:
+            logging.info(message)
+
+    def _enqueue_log(self, line: str):
+        """ログ行をバッファに積み、LOG_FLUSH_MS後にまとめて表示"""
+        self._log_buffer.append(line)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """バッファ中のログ行を1回のappendでログエリアへ追記"""
+        self._log_flush_pending = False
+        if self._log_buffer:
+            self.log_text.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def start_worker(self, task) -> ProcessWorker:
+        """taskをProcessWorkerでスレッドプール上で実行
+        ワーカーからの通知はシグナル（キュー接続）でGUIスレッドへ渡す"""
+        worker = ProcessWorker(task)
+        worker.signals.progress.connect(self.log_message)
+        worker.signals.finished.connect(self.on_process_finished)
+        worker.start()
+        return worker
 
     def on_process_finished(self, success: bool, message: str):
         """処理完了時のハンドラ"""
         self.progress_bar.setVisible(False)
 
+        self.log_message(f"✓ {message}" if success else f"✗ {message}")
+        # 1回の処理分のログはここでファイルへ書き出し、設定も保存しておく
+        self.flush_log_file()
+        self.schedule_save_settings()
+
         if success:
-            self.log_message(f"✓ {message}")
             self.status_bar.showMessage("処理完了")
             QMessageBox.information(self, "完了", message)
         else:
-            self.log_message(f"✗ {message}")
             self.status_bar.showMessage("処理失敗")
             QMessageBox.critical(self, "エラー", message)
 
@@ -1191,117 +1697,144 @@ class LoudSyncSuiteMainWindow(QMainWindow):
         """設定を読み込み"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                # orjsonがあれば使用（読み取り専用なので共有キャッシュの辞書でよい）
+                settings = _read_config(self.config_path,
+                                        os.stat(self.config_path).st_mtime_ns)
 
                 self.log_message(f"設定ファイルを読み込み中: {self.config_path}")
 
-                # Normalizeタブの設定を復元
+                # Normalizeタブの設定を復元（モード変更とプリセット変更は最後に1回だけ反映）
                 if hasattr(self, 'normalize_tab'):
-                    if "input_directory" in settings and settings["input_directory"] != "入力フォルダが選択されていません":
-                        self.normalize_tab.input_dir_edit.setText(
-                            settings["input_directory"])
-                        self.log_message(
-                            f"入力フォルダを復元: {settings['input_directory']}")
-
-                    if "output_directory" in settings and settings["output_directory"] != "出力フォルダが選択されていません":
-                        self.normalize_tab.output_dir_edit.setText(
-                            settings["output_directory"])
-                        self.log_message(
-                            f"出力フォルダを復元: {settings['output_directory']}")
-
-                    if "mode" in settings:
-                        mode = settings["mode"]
-                        if mode.get("measure_only", False):
-                            self.normalize_tab.mode_measure_radio.setChecked(
-                                True)
-                            self.log_message("モード: 測定のみ")
-                        elif mode.get("normalize", False):
-                            self.normalize_tab.mode_normalize_radio.setChecked(
-                                True)
-                            self.log_message("モード: 正規化")
-
-                    if "preset_index" in settings:
-                        preset_idx = settings["preset_index"]
-                        if 0 <= preset_idx < self.normalize_tab.preset_combo.count():
-                            self.normalize_tab.preset_combo.setCurrentIndex(
-                                preset_idx)
-                            self.log_message(f"プリセットを復元: {preset_idx}")
-
-                    if "reference_file" in settings and hasattr(self.normalize_tab, 'reference_file_edit'):
-                        ref_file = settings["reference_file"]
-                        if ref_file and ref_file != "参照ファイルが選択されていません":
-                            self.normalize_tab.reference_file_edit.setText(
-                                ref_file)
-                            self.log_message(f"参照ファイルを復元: {ref_file}")
-
-                    if "output_format" in settings:
-                        format_text = settings["output_format"]
-                        format_idx = self.normalize_tab.format_combo.findText(
-                            format_text)
-                        if format_idx >= 0:
-                            self.normalize_tab.format_combo.setCurrentIndex(
-                                format_idx)
-                            self.log_message(f"出力形式を復元: {format_text}")
-
-                    # ウィンドウ位置とサイズの復元
-                    if "window_geometry" in settings:
-                        geo = settings["window_geometry"]
-                        self.setGeometry(geo.get("x", 100), geo.get("y", 100),
-                                         geo.get("width", 1000), geo.get("height", 700))
-
-                    # モード変更とプリセット変更を反映
-                    self.normalize_tab.on_mode_changed()
-                    if hasattr(self.normalize_tab, 'on_preset_changed'):
-                        self.normalize_tab.on_preset_changed()
-
+                    with self.normalize_tab.restoring():
+                        if "input_directory" in settings and settings["input_directory"] != "入力フォルダが選択されていません":
+                            self.normalize_tab.input_dir_edit.setText(
+                                settings["input_directory"])
+                            self.log_message(
+                                f"入力フォルダを復元: {settings['input_directory']}")
+
+                        if "output_directory" in settings and settings["output_directory"] != "出力フォルダが選択されていません":
+                            self.normalize_tab.output_dir_edit.setText(
+                                settings["output_directory"])
+                            self.log_message(
+                                f"出力フォルダを復元: {settings['output_directory']}")
+
+                        if "mode" in settings:
+                            mode = settings["mode"]
+                            if mode.get("measure_only", False):
+                                self.normalize_tab.mode_measure_radio.setChecked(
+                                    True)
+                                self.log_message("モード: 測定のみ")
+                            elif mode.get("normalize", False):
+                                self.normalize_tab.mode_normalize_radio.setChecked(
+                                    True)
+                                self.log_message("モード: 正規化")
+
+                        if "preset_index" in settings:
+                            preset_idx = settings["preset_index"]
+                            if 0 <= preset_idx < self.normalize_tab.preset_combo.count():
+                                self.normalize_tab.preset_combo.setCurrentIndex(
+                                    preset_idx)
+                                self.log_message(f"プリセットを復元: {preset_idx}")
+
+                        if "reference_file" in settings and hasattr(self.normalize_tab, 'reference_file_edit'):
+                            ref_file = settings["reference_file"]
+                            if ref_file and ref_file != "参照ファイルが選択されていません":
+                                self.normalize_tab.reference_file_edit.setText(
+                                    ref_file)
+                                self.log_message(f"参照ファイルを復元: {ref_file}")
+
+                        if "output_format" in settings:
+                            format_text = settings["output_format"]
+                            format_idx = self.normalize_tab.format_combo.findText(
+                                format_text)
+                            if format_idx >= 0:
+                                self.normalize_tab.format_combo.setCurrentIndex(
+                                    format_idx)
+                                self.log_message(f"出力形式を復元: {format_text}")
+
+                        # ウィンドウ位置とサイズの復元
+                        if "window_geometry" in settings:
+                            geo = settings["window_geometry"]
+                            self.setGeometry(geo.get("x", 100), geo.get("y", 100),
+                                             geo.get("width", 1000), geo.get("height", 700))
+
+                self._saved_settings = self.collect_settings()
                 self.log_message("設定を正常に読み込みました")
             except Exception as e:
                 self.log_message(f"設定読み込みエラー: {e}")
         else:
             self.log_message(f"設定ファイルが見つかりません: {self.config_path}")
 
-    def save_settings(self):
-        """設定を保存"""
+    def collect_settings(self) -> dict:
+        """現在の設定を辞書にまとめる（GUIスレッドで呼ぶ）"""
+        settings = {}
+
+        # Normalizeタブの設定を保存
+        if hasattr(self, 'normalize_tab'):
+            settings.update({
+                "input_directory": self.normalize_tab.input_dir_edit.text(),
+                "output_directory": self.normalize_tab.output_dir_edit.text(),
+                "mode": {
+                    "measure_only": self.normalize_tab.mode_measure_radio.isChecked(),
+                    "normalize": self.normalize_tab.mode_normalize_radio.isChecked(),
+                },
+                "preset_index": self.normalize_tab.preset_combo.currentIndex(),
+                "preset_name": self.normalize_tab.preset_combo.currentText(),
+                "reference_file": getattr(self.normalize_tab, 'reference_file_edit', QLabel()).text(),
+                "output_format": self.normalize_tab.format_combo.currentText(),
+                "saved_at": str(Path().cwd()),
+                "window_geometry": {
+                    "x": self.x(),
+                    "y": self.y(),
+                    "width": self.width(),
+                    "height": self.height()
+                }
+            })
+        return settings
+
+    def schedule_save_settings(self):
+        """設定保存を予約（SETTINGS_SAVE_DEBOUNCE_MS以内の要求はまとめて1回）"""
+        self._settings_timer.start()
+
+    def save_settings(self, background: bool = False):
+        """設定を保存（前回保存時から変化がなければ何もしない）
+        background=True ではファイルへの書き込みをスレッドプールで行う"""
+        self._settings_timer.stop()
         try:
-            settings = {}
-
-            # Normalizeタブの設定を保存
-            if hasattr(self, 'normalize_tab'):
-                settings.update({
-                    "input_directory": self.normalize_tab.input_dir_edit.text(),
-                    "output_directory": self.normalize_tab.output_dir_edit.text(),
-                    "mode": {
-                        "measure_only": self.normalize_tab.mode_measure_radio.isChecked(),
-                        "normalize": self.normalize_tab.mode_normalize_radio.isChecked(),
-                    },
-                    "preset_index": self.normalize_tab.preset_combo.currentIndex(),
-                    "preset_name": self.normalize_tab.preset_combo.currentText(),
-                    "reference_file": getattr(self.normalize_tab, 'reference_file_edit', QLabel()).text(),
-                    "output_format": self.normalize_tab.format_combo.currentText(),
-                    "saved_at": str(Path().cwd()),
-                    "window_geometry": {
-                        "x": self.x(),
-                        "y": self.y(),
-                        "width": self.width(),
-                        "height": self.height()
-                    }
-                })
-
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            settings = self.collect_settings()
+        except Exception as e:
+            self.log_message(f"設定保存エラー: {e}")
+            return
+        if settings == self._saved_settings:
+            return
+        self._saved_settings = settings
+        if background:
+            submit_to_pool(self._write_settings, settings)
+        else:
+            self._write_settings(settings)
+
+    def _write_settings(self, settings: dict):
+        from gui._atomic import dump_json_atomic
+        try:
+            with self._settings_lock:
+                dump_json_atomic(self.config_path, settings)
             self.log_message("設定を保存しました")
         except Exception as e:
+            self._saved_settings = None  # 次回は再度書き込む
             self.log_message(f"設定保存エラー: {e}")
 
     def closeEvent(self, event):
         """終了時の処理"""
         self.save_settings()
 
+        # 実行中のffmpegを終了（POSIXではジョブオブジェクトがないため明示的に止める）
+        from audioops._proc import terminate_children
+        terminate_children()
+
         # ログハンドラをクリーンアップ
-        if hasattr(self, 'file_handler'):
-            logging.getLogger().removeHandler(self.file_handler)
-            self.file_handler.close()
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.log_listener.stop()
+        self.close_log_file()
 
         event.accept()
 
@@ -35,6 +35,11 @@ def main():
     pipeline_parser.add_argument('--preset', default='podcast',
                                  choices=['podcast', 'bgm', 'broadcast'],
                                  help='プリセット設定')
+    pipeline_parser.add_argument('--parallel', '--jobs', '-j', type=int, default=0,
+                                 help='同時に走らせるffmpeg数（0=CPU数/スレッド数）')
+    pipeline_parser.add_argument('--auto-pass-threshold-sec', type=float, default=0,
+                                 help='この秒数より短いファイルは1パス正規化'
+                                      '（約2倍速いが精度はやや低い。0=常に2パス）')
 
     # Fade コマンド
     fade_parser = subparsers.add_parser('fade', help='フェード処理')
@@ -47,6 +52,11 @@ def main():
     fade_parser.add_argument('--from-end', type=float,
                              default=2.0, help='アウト開始(秒)')
     fade_parser.add_argument('--codec', default='aac', help='コーデック')
+    fade_parser.add_argument('--parallel', '--jobs', '-j', type=int, default=0,
+                             help='同時に処理するファイル数（0=CPU数の半分）')
+    fade_parser.add_argument('--ffmpeg-threads-per-invocation', type=int,
+                             default=0,
+                             help='ffmpeg 1プロセスあたりのスレッド数（0=CPU数/並列数）')
 
     # Crossfade コマンド
     crossfade_parser = subparsers.add_parser('crossfade', help='クロスフェード連結')
@@ -103,14 +113,17 @@ def run_cli_command(args):
 def run_pipeline_command(args):
     """パイプラインコマンドを実行"""
     try:
+        from concurrent.futures import ThreadPoolExecutor
         from audioops.pipeline import create_preset_config, run_pipeline
+        from audioops.loudsync_legacy import find_audio_files, find_ffmpeg
 
-        # 音声ファイルを検索
-        input_dir = Path(args.input_dir)
+        # 音声ファイルを検索（拡張子ごとのglobではなく1回のディレクトリ走査で収集）
+        # ffmpegの検出は独立しているので走査と並行して行う
         extensions = ['.wav', '.mp3', '.m4a', '.flac']
-        input_files = []
-        for ext in extensions:
-            input_files.extend(input_dir.glob(f"**/*{ext}"))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ffmpeg_future = executor.submit(find_ffmpeg)
+            input_files = find_audio_files(args.input_dir, extensions)
+            ffmpeg_path = ffmpeg_future.result()
 
         if not input_files:
             print(f"No audio files found in {args.input_dir}")
@@ -118,6 +131,11 @@ def run_pipeline_command(args):
 
         # 設定を作成
         config = create_preset_config(args.preset)
+        config.paths['ffmpeg'] = ffmpeg_path
+        if args.parallel > 0:
+            config.paths['max_parallel_jobs'] = args.parallel
+        if args.auto_pass_threshold_sec > 0:
+            config.normalize['auto_pass_threshold_sec'] = args.auto_pass_threshold_sec
 
         # パイプライン実行
         success = run_pipeline(input_files, Path(args.output_file), config)
@@ -132,29 +150,51 @@ def run_pipeline_command(args):
 def run_fade_command(args):
     """フェードコマンドを実行"""
     try:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
         from audioops.core import fade_file
+        from audioops.loudsync_legacy import find_ffmpeg, threads_per_invocation
 
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        # ffmpegは1回だけ解決（同梱のbin/ffmpeg.exeも対象）
+        ffmpeg_path = find_ffmpeg()
 
-        for i, input_file in enumerate(args.input_files, 1):
-            input_path = Path(input_file)
+        # ファイルごとのffmpegは独立しているので並列に実行（完了順に表示）
+        input_paths = [Path(f) for f in args.input_files]
+        max_workers = (args.parallel if args.parallel > 0
+                       else max(1, (os.cpu_count() or 1) // 2))
+        # 同時に動くffmpeg同士でCPUを取り合わないよう、1プロセスあたりのスレッド数を制限
+        threads = (args.ffmpeg_threads_per_invocation
+                   or threads_per_invocation(min(max_workers, len(input_paths))))
+        # 全ファイル共通の引数はループの外で1回だけ組み立てる
+        fade_args = dict(
+            fade_in_ms=args.fade_in,
+            fade_out_ms=args.fade_out,
+            fade_out_from_end_sec=args.from_end,
+            codec=args.codec,
+            ffmpeg_path=ffmpeg_path,
+            threads=threads
+        )
+
+        def fade_one(input_path: Path) -> Path:
             output_path = output_dir / \
                 f"{input_path.stem}_fade{input_path.suffix}"
-
-            print(f"[{i}/{len(args.input_files)}] Processing: {input_path.name}")
-
-            fade_file(
-                input_path, output_path,
-                fade_in_ms=args.fade_in,
-                fade_out_ms=args.fade_out,
-                fade_out_from_end_sec=args.from_end,
-                codec=args.codec
-            )
-
-            print(f"  ✓ Output: {output_path}")
-
-        return 0
+            fade_file(input_path, output_path, **fade_args)
+            return output_path
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fade_one, p): p for p in input_paths}
+            # 完了順に「[完了数/総数] ファイル名」と結果(✓/✗)を表示
+            for done, future in enumerate(as_completed(futures), 1):
+                print(f"[{done}/{len(input_paths)}] {futures[future].name}")
+                try:
+                    print(f"  ✓ Output: {future.result()}")
+                except Exception as e:
+                    failed += 1
+                    print(f"  ✗ Fade error: {e}")
+
+        return 1 if failed else 0
 
     except Exception as e:
         print(f"Fade error: {e}")
@@ -165,6 +205,7 @@ def run_crossfade_command(args):
     """クロスフェードコマンドを実行"""
     try:
         from audioops.core import crossfade_sequence
+        from audioops.loudsync_legacy import find_ffmpeg
 
         if len(args.input_files) < 2:
             print("Crossfade requires at least 2 input files")
@@ -181,7 +222,8 @@ def run_crossfade_command(args):
             overlap_sec=args.overlap,
             curve1=args.curve,
             curve2=args.curve,
-            codec=args.codec
+            codec=args.codec,
+            ffmpeg_path=find_ffmpeg()
         )
 
         print(f"✓ Output: {output_path}")
@@ -193,4 +235,7 @@ def run_crossfade_command(args):
 
 
 if __name__ == "__main__":
+    # 凍結(PyInstaller)版でもプロセスプールの子プロセスを起動できるようにする
+    import multiprocessing
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+audioops.core のPython内フェード/クロスフェード（ffmpegを起動しない16bit PCM WAV経路）のテスト
+合成したWAVを wave で書き出し、afade/acrossfade と同じ計算になっているかを確認する
+"""
+
+import tempfile
+import unittest
+import wave
+from array import array
+from pathlib import Path
+
+from audioops import core
+
+RATE = 1000  # 1フレーム = 1ms で計算しやすくする
+
+
+def write_wav(path: Path, samples, nchannels: int = 1, sampwidth: int = 2,
+              rate: int = RATE):
+    """samples（インターリーブ済み）をWAVとして書き出す"""
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(nchannels)
+        w.setsampwidth(sampwidth)
+        w.setframerate(rate)
+        if sampwidth == 2:
+            w.writeframes(array("h", samples).tobytes())
+        else:
+            w.writeframes(bytes(len(samples) * sampwidth))
+
+
+def read_wav(path: Path):
+    """(params, サンプル配列) を返す"""
+    with wave.open(str(path), "rb") as w:
+        params = w.getparams()
+        return params, array("h", w.readframes(params.nframes))
+
+
+class FadePcmWavTest(unittest.TestCase):
+    """_fade_pcm_wav（afade=t=in/out の tri カーブ相当）"""
+
+    AMP = 10000
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.src = self.tmp / "in.wav"
+        self.dst = self.tmp / "out.wav"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def assertRamp(self, out, start: int, count: int, n: int, fade_in: bool):
+        # k番目のゲインは k/n（フェードイン）または 1 - k/n（フェードアウト）
+        for k in range(count):
+            gain = k / n if fade_in else 1 - k / n
+            self.assertAlmostEqual(out[start + k], self.AMP * gain, delta=2,
+                                   msg=f"frame {start + k}")
+
+    def test_fade_in_and_out(self):
+        write_wav(self.src, [self.AMP] * 1000)
+        # フェードイン100ms、600msから200msでフェードアウト（800ms以降は無音）
+        self.assertTrue(core._fade_pcm_wav(self.src, self.dst, 0.1, 0.6, 0.2))
+
+        params, out = read_wav(self.dst)
+        self.assertEqual(params.nframes, 1000)
+        self.assertEqual(out[0], 0)
+        self.assertRamp(out, 0, 100, 100, fade_in=True)
+        self.assertTrue(all(v == self.AMP for v in out[100:600]))
+        self.assertRamp(out, 600, 200, 200, fade_in=False)
+        self.assertTrue(all(v == 0 for v in out[800:]))
+
+    def test_stereo_keeps_frame_count(self):
+        write_wav(self.src, [self.AMP, -self.AMP] * 500, nchannels=2)
+        self.assertTrue(core._fade_pcm_wav(self.src, self.dst, 0.1, 0.4, 0.1))
+
+        params, out = read_wav(self.dst)
+        self.assertEqual(params.nframes, 500)
+        self.assertEqual(params.nchannels, 2)
+        # 両チャンネルに同じゲインが掛かる（負の値は右シフトで切り下がる分だけずれる）
+        for k in range(100):
+            self.assertAlmostEqual(out[2 * k], -out[2 * k + 1], delta=1)
+
+    def test_file_shorter_than_fade_in_follows_slope(self):
+        # 100フレームのファイルに200msのフェードイン: ランプの途中（約0.5）で終わる
+        write_wav(self.src, [self.AMP] * 100)
+        self.assertTrue(core._fade_pcm_wav(self.src, self.dst, 0.2, 0.1, 0.0))
+
+        params, out = read_wav(self.dst)
+        self.assertEqual(params.nframes, 100)
+        self.assertRamp(out, 0, 100, 200, fade_in=True)
+        self.assertLess(out[-1], self.AMP * 0.5)
+
+    def test_non_16bit_input_falls_back(self):
+        for sampwidth in (1, 3):
+            with self.subTest(sampwidth=sampwidth):
+                write_wav(self.src, [0] * 100, sampwidth=sampwidth)
+                self.assertFalse(core._fade_pcm_wav(self.src, self.dst, 0.01, 0.05, 0.01))
+
+    def test_overlapping_fades_fall_back(self):
+        # フェードイン(0〜60ms)とフェードアウト(50ms〜)が重なる
+        write_wav(self.src, [self.AMP] * 100)
+        self.assertFalse(core._fade_pcm_wav(self.src, self.dst, 0.06, 0.05, 0.05))
+
+
+class CrossfadePcmWavTest(unittest.TestCase):
+    """_crossfade_pcm_wav / _crossfade_gains / _mix（acrossfade相当）"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.dst = self.tmp / "out.wav"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def inputs(self, specs):
+        """[(サンプル列, チャンネル数, サンプリング周波数), ...] をWAVにしてパスを返す"""
+        paths = []
+        for i, (samples, nchannels, rate) in enumerate(specs):
+            path = self.tmp / f"in{i}.wav"
+            write_wav(path, samples, nchannels=nchannels, rate=rate)
+            paths.append(path)
+        return paths
+
+    def test_output_length(self):
+        lengths = [300, 250, 400]
+        n = 100
+        paths = self.inputs([([1000] * length, 1, RATE) for length in lengths])
+        self.assertTrue(core._crossfade_pcm_wav(paths, self.dst, n / RATE, "tri", "tri"))
+
+        params, out = read_wav(self.dst)
+        self.assertEqual(params.nframes, sum(lengths) - n * (len(lengths) - 1))
+        self.assertEqual(len(out), params.nframes)
+
+    def test_tri_overlap_matches_acrossfade(self):
+        n = 100
+        a = [(7 * k) % 20000 - 10000 for k in range(300)]
+        b = [(13 * k) % 16000 - 8000 for k in range(300)]
+        paths = self.inputs([(a, 1, RATE), (b, 1, RATE)])
+        self.assertTrue(core._crossfade_pcm_wav(paths, self.dst, n / RATE, "tri", "tri"))
+
+        _, out = read_wav(self.dst)
+        self.assertEqual(list(out[:300 - n]), a[:300 - n])
+        for k in range(n):
+            expected = a[300 - n + k] * (n - 1 - k) / n + b[k] * k / n
+            self.assertAlmostEqual(out[300 - n + k], expected, delta=2,
+                                   msg=f"overlap frame {k}")
+        self.assertEqual(list(out[300:]), b[n:])
+
+    def test_needs_clip(self):
+        # ゲインの和が常に1以下のカーブではクリップ不要
+        for curve in ("tri", "hsin", "qua"):
+            with self.subTest(curve=curve):
+                self.assertFalse(core._crossfade_gains(64, curve, curve)[2])
+        # 等パワーのqsin（中央で和が約1.41）などゲインの和が1を超えるカーブではクリップが必要
+        for curve in ("qsin", "squ"):
+            with self.subTest(curve=curve):
+                self.assertTrue(core._crossfade_gains(64, curve, curve)[2])
+
+    def test_clip16_saturates(self):
+        self.assertEqual(core._clip16(40000), 32767)
+        self.assertEqual(core._clip16(-40000), -32768)
+        self.assertEqual(core._clip16(1234), 1234)
+
+        # ゲイン2倍相当(Q15で65536)を両方に掛けると16bitを超えるので飽和する
+        gain = array("i", [2 << core._Q15] * 4)
+        loud = array("h", [30000, -30000] * 2).tobytes()
+        mixed = core._mix(loud, loud, 1, gain, gain, needs_clip=True)
+        self.assertEqual(list(mixed), [32767, -32768] * 2)
+
+    def test_mismatched_inputs_fall_back(self):
+        cases = {
+            "channels": [([0] * 300, 1, RATE), ([0] * 600, 2, RATE)],
+            "rate": [([0] * 300, 1, RATE), ([0] * 300, 1, 2 * RATE)],
+            "short middle": [([0] * 300, 1, RATE), ([0] * 150, 1, RATE),
+                             ([0] * 300, 1, RATE)],
+        }
+        for name, specs in cases.items():
+            with self.subTest(name):
+                paths = self.inputs(specs)
+                self.assertFalse(core._crossfade_pcm_wav(paths, self.dst, 0.1, "tri", "tri"))
+
+
+if __name__ == '__main__':
+    unittest.main()
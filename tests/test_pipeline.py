@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+audioops.pipeline のテスト（ffmpegは起動せず、測定・正規化関数を差し替えて確認）
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from audioops import pipeline
+
+
+def _measured(file_path: str) -> dict:
+    return {'file': file_path, 'integrated_lufs': -20.0, 'loudness_range': 5.0,
+            'true_peak_dbtp': -3.0, 'status': 'OK',
+            'raw_json': {'input_i': '-20.00', 'input_tp': '-3.00', 'input_lra': '5.00',
+                         'input_thresh': '-30.00', 'target_offset': '0.00'}}
+
+
+class AutoPassThresholdBatchFallbackTest(unittest.TestCase):
+    """短いファイルはバッチ失敗時のファイル単位フォールバックでも再測定しない"""
+
+    def test_short_files_fall_back_to_one_pass(self):
+        config = pipeline.PipelineConfig()
+        config.normalize['two_pass'] = True
+        config.normalize['auto_pass_threshold_sec'] = 10
+        config.fade['enabled'] = False
+
+        # BATCH_MIN_FILES より多くしてバッチ経路を通す（偶数番目が短いファイル）
+        files = [Path(f"in{i}.wav") for i in range(pipeline.BATCH_MIN_FILES + 2)]
+        short = {f for i, f in enumerate(files) if i % 2 == 0}
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(pipeline, 'duration_sec',
+                                  side_effect=lambda p: 1.0 if p in short else 60.0), \
+                mock.patch.object(pipeline, 'measure_loudness',
+                                  side_effect=lambda p, *a, **k: _measured(p)) as measure, \
+                mock.patch.object(pipeline, 'normalize_batch', return_value=False), \
+                mock.patch.object(pipeline, 'normalize_audio',
+                                  return_value=True) as normalize:
+            info = pipeline.probe_files(files, config, 'ffmpeg')
+            cache_dirs = {'normalized': Path(tmp)}
+            outputs = pipeline.run_normalize_batches(
+                files, config, cache_dirs, 'ffmpeg', 2, info)
+
+        self.assertEqual(len(outputs), len(files))
+        # 測定は長いファイルだけ
+        self.assertEqual({Path(c.args[0]) for c in measure.call_args_list},
+                         set(files) - short)
+
+        calls = {Path(c.args[0]): c for c in normalize.call_args_list}
+        self.assertEqual(set(calls), set(files))
+        for file_path, call in calls.items():
+            two_pass = call.args[6]
+            if file_path in short:
+                self.assertFalse(two_pass)
+                self.assertIsNone(call.kwargs['measured'])
+                self.assertEqual(call.kwargs['mode'], 'loudnorm_2pass')
+            else:
+                self.assertTrue(two_pass)
+                self.assertEqual(call.kwargs['measured']['status'], 'OK')
+
+
+if __name__ == '__main__':
+    unittest.main()